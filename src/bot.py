@@ -1,41 +1,159 @@
 import asyncio
+import atexit
+import functools
+import hashlib
+import itertools
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import random
+import re
+import textwrap
+import time
+from collections import OrderedDict, deque
+from types import MappingProxyType
 from typing import List, Optional
 
 import discord
 from discord import app_commands
+import httpx
+import numpy as np
 import openai
-import requests
+import orjson
 from discord.ext import commands
 from dotenv import load_dotenv
+from rapidfuzz import fuzz, process, utils
+
+from embedding_cache import EmbeddingCache
 
 # Load environment variables
 load_dotenv()
 
+# Read configuration once at import time
+DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
+CLICKUP_API_TOKEN = os.getenv('CLICKUP_API_TOKEN')
+CLICKUP_LIST_ID = os.getenv('CLICKUP_LIST_ID')
+CLICKUP_TEAM_ID = os.getenv('CLICKUP_TEAM_ID')
+CLICKUP_FOLDER_ID = os.getenv('CLICKUP_FOLDER_ID')
+OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+EMBEDDING_CACHE_PATH = os.getenv('EMBEDDING_CACHE_PATH', 'data/embeddings.sqlite3')
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# discord.py logs every gateway event at INFO; only surface its warnings
+logging.getLogger('discord').setLevel(logging.WARNING)
+
+# One pooled HTTP/2 client for all outbound HTTP (ClickUp and OpenAI), so
+# bursts of requests to the same host share a multiplexed connection
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    timeout=httpx.Timeout(10.0)
+)
 
 # Configure OpenAI
-openai.api_key = os.getenv('OPENAI_API_KEY')
+# Completions can take well over the 10s ClickUp budget to start streaming, so the
+# OpenAI client gets its own timeout rather than inheriting the shared client's
+_OPENAI_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+# Async client so completions don't block the Discord event loop
+openai_client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client, timeout=_OPENAI_TIMEOUT) if OPENAI_API_KEY else None
+# Short classification, titling and pick-a-number ranking use the cheaper, faster model;
+# free-form reasoning over the conversation keeps the full one
+_FAST_MODEL = "gpt-4o-mini"
+_SMART_MODEL = "gpt-4o"
+_EMBEDDING_MODEL = "text-embedding-3-small"
 
 class ClickUpClient:
     """Client for interacting with ClickUp API"""
     
-    def __init__(self, api_token: str, list_id: str, team_id: Optional[str] = None, folder_id: Optional[str] = None):
+    # Fields shared by every task created from Discord; read-only so no call can leak into the next
+    _TASK_TEMPLATE = MappingProxyType({
+        "priority": 3,  # Normal priority
+        "due_date": None,
+        "due_date_time": False,
+        "time_estimate": None,
+        "start_date": None,
+        "start_date_time": False,
+        "notify_all": True,
+        "parent": None,
+        "links_to": None,
+        "check_required_custom_fields": True,
+        "custom_fields": ()
+    })
+    
+    # Rate limits and gateway hiccups are worth retrying; everything else surfaces immediately.
+    # A POST that timed out at the gateway may already have created something, so POSTs
+    # only retry when ClickUp explicitly rejected them with 429
+    _RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    _POST_RETRY_STATUSES = frozenset({429})
+    _MAX_ATTEMPTS = 6
+    _BACKOFF_BASE = 0.5
+    _BACKOFF_JITTER = 0.5
+    _BACKOFF_CAP = 30.0
+    
+    def __init__(self, api_token: str, list_id: str, team_id: Optional[str] = None, folder_id: Optional[str] = None, http: Optional[httpx.AsyncClient] = None):
         self.api_token = api_token
         self.list_id = list_id  # Backlog list ID
         self.team_id = team_id
         self.folder_id = folder_id  # Folder ID for current sprint lists
         self.base_url = "https://api.clickup.com/api/v2"
-        self.headers = {
+        # Built once and read-only; every request passes this same mapping
+        self.headers = MappingProxyType({
             "Authorization": api_token,
             "Content-Type": "application/json"
-        }
-
-    def get_team_members(self) -> List[dict]:
+        })
+        # Pooled HTTP client, normally the process-wide one shared with OpenAI
+        self._owns_http = http is None
+        self._http = http or httpx.AsyncClient()
+        # Sprint folder lists change at most once per sprint, so keep them for a few minutes
+        self._lists_cache: Optional[List[dict]] = None
+        self._lists_cache_ts = 0.0
+        self._lists_ttl = 300
+        self._lists_lock = asyncio.Lock()
+        # (lists it was picked from, newest list); valid while get_folder_lists returns that same object
+        self._newest_list: Optional[tuple[List[dict], dict]] = None
+        # Task lists by list id; short-lived so a burst of commands shares one fetch
+        self._tasks_cache: dict[str, tuple[float, List[dict]]] = {}
+        self._tasks_ttl = 30
+        self._tasks_lock = asyncio.Lock()
+        # Cap in-flight ClickUp requests so a burst of mentions can't trip the rate limit
+        self._semaphore = asyncio.Semaphore(8)
+
+    async def close(self):
+        """Close the HTTP client if this ClickUp client created it"""
+        if self._owns_http:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> "ClickUpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a ClickUp request, retrying 429/5xx responses with exponential backoff"""
+        retry_statuses = self._POST_RETRY_STATUSES if method == "POST" else self._RETRY_STATUSES
+        for attempt in range(self._MAX_ATTEMPTS):
+            # The slot is held for the request only, not while backing off
+            async with self._semaphore:
+                response = await self._http.request(method, url, headers=self.headers, **kwargs)
+            if response.status_code not in retry_statuses or attempt == self._MAX_ATTEMPTS - 1:
+                return response
+            
+            delay = self._BACKOFF_BASE * 2 ** attempt + random.random() * self._BACKOFF_JITTER
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+            delay = min(delay, self._BACKOFF_CAP)
+            logger.warning("ClickUp returned %d for %s %s, retrying in %.1fs", response.status_code, method, url, delay)
+            await asyncio.sleep(delay)
+
+    async def get_team_members(self) -> List[dict]:
         """Get members of the ClickUp team"""
         if not self.team_id:
             return []
@@ -43,116 +161,144 @@ class ClickUpClient:
         url = f"{self.base_url}/team/{self.team_id}/member"
 
         try:
-            response = requests.get(url, headers=self.headers)
+            response = await self._request("GET", url)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("members", [])
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get team members: {e}")
-            if hasattr(e, "response") and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
+        except httpx.HTTPError as e:
+            logger.error("Failed to get team members: %s", e)
+            response = getattr(e, 'response', None)
+            if response is not None:
+                logger.error("Response content: %s", response.text)
             return []
     
-    def get_folder_lists(self) -> List[dict]:
+    async def get_folder_lists(self) -> List[dict]:
         """Get all lists from the specified folder"""
         if not self.folder_id:
             return []
         
-        url = f"{self.base_url}/folder/{self.folder_id}/list"
-        
-        try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("lists", [])
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get folder lists: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
-            return []
+        # Concurrent callers wait for a single in-flight request
+        async with self._lists_lock:
+            if self._lists_cache is not None and time.monotonic() - self._lists_cache_ts < self._lists_ttl:
+                return self._lists_cache
+            
+            url = f"{self.base_url}/folder/{self.folder_id}/list"
+            
+            try:
+                response = await self._request("GET", url)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                self._lists_cache = data.get("lists", [])
+                self._lists_cache_ts = time.monotonic()
+                return self._lists_cache
+            except httpx.HTTPError as e:
+                logger.error("Failed to get folder lists: %s", e)
+                response = getattr(e, 'response', None)
+                if response is not None:
+                    logger.error("Response content: %s", response.text)
+                return []
     
-    def get_newest_list_from_folder(self) -> Optional[dict]:
+    def invalidate_lists_cache(self):
+        """Force the next get_folder_lists call to refetch from ClickUp"""
+        self._lists_cache = None
+        self._lists_cache_ts = 0.0
+    
+    async def get_newest_list_from_folder(self) -> Optional[dict]:
         """Get the newest list from the folder (current sprint)"""
-        lists = self.get_folder_lists()
+        lists = await self.get_folder_lists()
         
         if not lists:
             logger.warning("No lists found in folder")
             return None
         
+        # Same cached lists as last time, so the same pick; skip the scan and its logging
+        if self._newest_list is not None and self._newest_list[0] is lists:
+            return self._newest_list[1]
+        
         # Since ClickUp returns lists in order and dates aren't available,
         # take the LAST list in the array (newest sprint)
         newest_list = lists[-1]  # Last item = newest
         
-        logger.info(f"Available lists in order:")
-        for i, lst in enumerate(lists):
-            marker = " <- SELECTED (NEWEST)" if lst == newest_list else ""
-            logger.info(f"  {i+1}. {lst.get('name')}{marker}")
+        if logger.isEnabledFor(logging.INFO):
+            newest_id = newest_list.get('id')
+            logger.info("Available lists in order:")
+            for i, lst in enumerate(lists):
+                marker = " <- SELECTED (NEWEST)" if lst.get('id') == newest_id else ""
+                logger.info("  %d. %s%s", i + 1, lst.get('name'), marker)
         
-        logger.info(f"Selected newest list: {newest_list.get('name')} (ID: {newest_list.get('id')})")
+        logger.info("Selected newest list: %s (ID: %s)", newest_list.get('name'), newest_list.get('id'))
+        self._newest_list = (lists, newest_list)
         return newest_list
     
-    def create_task(self, name: str, description: str, list_id: Optional[str] = None, assignees: Optional[list] = None) -> dict:
+    async def create_task(self, name: str, description: str, list_id: Optional[str] = None, assignees: Optional[list] = None) -> dict:
         """Create a new task in ClickUp"""
         # Use provided list_id or default to backlog
         target_list_id = list_id or self.list_id
         url = f"{self.base_url}/list/{target_list_id}/task"
         
-        task_data = {
-            "name": name,
-            "description": description,
-            "priority": 3,  # Normal priority
-            "due_date": None,
-            "due_date_time": False,
-            "time_estimate": None,
-            "start_date": None,
-            "start_date_time": False,
-            "notify_all": True,
-            "parent": None,
-            "links_to": None,
-            "check_required_custom_fields": True,
-            "custom_fields": []
-        }
+        task_data = {**self._TASK_TEMPLATE, "name": name, "description": description}
         
         if assignees:
             task_data["assignees"] = assignees
         
         try:
-            response = requests.post(url, json=task_data, headers=self.headers)
+            # orjson serializes straight to bytes; headers already carry the JSON content type
+            response = await self._request("POST", url, content=orjson.dumps(task_data))
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to create ClickUp task: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
+            self.invalidate_tasks_cache()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error("Failed to create ClickUp task: %s", e)
+            response = getattr(e, 'response', None)
+            if response is not None:
+                logger.error("Response content: %s", response.text)
             raise
 
-    def get_tasks_from_list(self, list_id: str) -> List[dict]:
+    async def get_tasks_from_list(self, list_id: str) -> List[dict]:
         """Get all tasks from a specific list"""
-        url = f"{self.base_url}/list/{list_id}/task"
-        
-        try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("tasks", [])
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to get tasks from list {list_id}: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
-            return []
+        # Concurrent callers wait for a single in-flight request
+        async with self._tasks_lock:
+            cached = self._tasks_cache.get(list_id)
+            if cached is not None and time.monotonic() - cached[0] < self._tasks_ttl:
+                return cached[1]
+            
+            url = f"{self.base_url}/list/{list_id}/task"
+            
+            try:
+                response = await self._request("GET", url)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                tasks = data.get("tasks", [])
+                self._tasks_cache[list_id] = (time.monotonic(), tasks)
+                return tasks
+            except httpx.HTTPError as e:
+                logger.error("Failed to get tasks from list %s: %s", list_id, e)
+                response = getattr(e, 'response', None)
+                if response is not None:
+                    logger.error("Response content: %s", response.text)
+                return []
     
-    def get_tasks_from_newest_sprint(self) -> List[dict]:
-        """Get all tasks from the newest sprint list"""
-        newest_list = self.get_newest_list_from_folder()
+    def invalidate_tasks_cache(self):
+        """Force the next get_tasks_from_list call to refetch from ClickUp"""
+        self._tasks_cache.clear()
+    
+    async def get_newest_sprint_with_list(self) -> tuple[Optional[dict], List[dict]]:
+        """Get the newest sprint list together with its tasks"""
+        newest_list = await self.get_newest_list_from_folder()
         if not newest_list:
             logger.warning("No newest sprint list found")
-            return []
+            return None, []
         
         list_id = newest_list.get('id')
-        logger.info(f"Getting tasks from newest sprint: {newest_list.get('name')} (ID: {list_id})")
-        return self.get_tasks_from_list(list_id)
+        logger.info("Getting tasks from newest sprint: %s (ID: %s)", newest_list.get('name'), list_id)
+        return newest_list, await self.get_tasks_from_list(list_id)
+    
+    async def get_tasks_from_newest_sprint(self) -> List[dict]:
+        """Get all tasks from the newest sprint list"""
+        _, tasks = await self.get_newest_sprint_with_list()
+        return tasks
     
-    def update_task_status(self, task_id: str, status: str) -> dict:
+    async def update_task_status(self, task_id: str, status: str) -> dict:
         """Update task status in ClickUp"""
         url = f"{self.base_url}/task/{task_id}"
         
@@ -161,67 +307,219 @@ class ClickUpClient:
         }
         
         try:
-            response = requests.put(url, json=task_data, headers=self.headers)
+            response = await self._request("PUT", url, content=orjson.dumps(task_data))
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to update task status: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
+            self.invalidate_tasks_cache()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error("Failed to update task status: %s", e)
+            response = getattr(e, 'response', None)
+            if response is not None:
+                logger.error("Response content: %s", response.text)
             raise
 
-    def assign_task(self, task_id: str, assignee_id: str) -> dict:
+    async def assign_task(self, task_id: str, assignee_id: str) -> dict:
         """Assign a user to a ClickUp task"""
         url = f"{self.base_url}/task/{task_id}/assignee/{assignee_id}"
 
         try:
-            response = requests.post(url, headers=self.headers)
+            response = await self._request("POST", url)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Failed to assign task: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response content: {e.response.text}")
+            self.invalidate_tasks_cache()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error("Failed to assign task: %s", e)
+            response = getattr(e, 'response', None)
+            if response is not None:
+                logger.error("Response content: %s", response.text)
             raise
 
+
+# Mentions are queued and handled by a fixed pool of workers so the reply path
+# never waits on OpenAI/ClickUp and bursts don't fan out unbounded
+_TASK_QUEUE_SIZE = 1000
+_TASK_WORKERS = 4
+task_queue: asyncio.Queue = asyncio.Queue(maxsize=_TASK_QUEUE_SIZE)
+
+class ClickUpBot(commands.Bot):
+    """Discord bot that runs the task workers and closes the shared HTTP client on shutdown"""
+
+    # ClickUp client, attached by main() once the environment has been validated
+    clickup: Optional[ClickUpClient] = None
+    # Persistent task embedding cache, also opened by main()
+    embedding_cache: Optional[EmbeddingCache] = None
+
+    async def setup_hook(self):
+        # Python 3.12+ can run new tasks eagerly until their first await,
+        # skipping a loop iteration for coroutines that finish synchronously
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory is not None:
+            asyncio.get_running_loop().set_task_factory(eager_task_factory)
+        
+        self._task_workers = [asyncio.create_task(task_worker()) for _ in range(_TASK_WORKERS)]
+        if openai_client is not None and self.clickup is not None:
+            self._task_workers.append(asyncio.create_task(warm_embedding_cache()))
+
+    async def close(self):
+        for worker in getattr(self, "_task_workers", ()):
+            worker.cancel()
+        await super().close()
+        await http_client.aclose()
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+
 # Initialize bot
 intents = discord.Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
-
-# Initialize ClickUp client
-clickup_client = ClickUpClient(
-    api_token=os.getenv('CLICKUP_API_TOKEN'),
-    list_id=os.getenv('CLICKUP_LIST_ID'),  # Backlog list
-    team_id=os.getenv('CLICKUP_TEAM_ID'),
-    folder_id=os.getenv('CLICKUP_FOLDER_ID')  # Sprint folder
-)
+bot = ClickUpBot(command_prefix='!', intents=intents, help_command=None)
+
+# Upper bounds on how much channel history is sent to OpenAI
+_MAX_CONTEXT_MESSAGE_CHARS = 300
+_MAX_CONTEXT_CHARS = 3000
+
+# Fenced code blocks (pasted stack traces, configs) cost many tokens and rarely help
+_CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+
+def _truncate_message(content: str) -> str:
+    """Collapse code blocks and cap a single message so one long paste can't dominate the prompt"""
+    if '```' in content:
+        content = _CODE_BLOCK_RE.sub('[code omitted]', content)
+    if len(content) <= _MAX_CONTEXT_MESSAGE_CHARS:
+        return content
+    return f"{content[:_MAX_CONTEXT_MESSAGE_CHARS]}…"
+
+def _number_messages(messages: List[str]) -> str:
+    """Number messages for a prompt, keeping the newest ones that fit the character budget"""
+    lines = []
+    total = 0
+    for i in range(len(messages) - 1, -1, -1):
+        line = f"{i+1}. {messages[i]}"
+        total += len(line) + 1
+        if total > _MAX_CONTEXT_CHARS:
+            break
+        lines.append(line)
+    lines.reverse()
+    return "\n".join(lines)
+
+# Recent context per channel id, oldest first, as (message id, author name, line)
+# entries; bot messages have no author name and they and text-less messages have
+# no line. A buffer is seeded from one history fetch and then kept current by
+# on_message and the edit/delete events, so later mentions don't refetch
+_CHANNEL_BUFFER_SIZE = 40
+_channel_buffers: dict[int, deque] = {}
+# History limit each buffer was seeded with; a larger request reseeds
+_seed_limits: dict[int, int] = {}
+
+def _context_line(author: Optional[str], content: str) -> Optional[str]:
+    """Format a message as "Author: message content", or None if it adds no context"""
+    if author is None or not content:
+        return None
+    return f"{author}: {_truncate_message(content)}"
+
+def _buffer_entry(message) -> tuple[int, Optional[str], Optional[str]]:
+    """Buffer entry for a Discord message"""
+    author = None if message.author.bot else message.author.display_name
+    return message.id, author, _context_line(author, message.content)
+
+def remember_message(message):
+    """Append a new message to its channel's buffer, if that channel has one"""
+    buffer = _channel_buffers.get(message.channel.id)
+    if buffer is not None:
+        buffer.append(_buffer_entry(message))
+
+def update_buffered_message(channel_id: int, message_id: int, content: str):
+    """Rewrite a buffered message's line after an edit; bot messages keep theirs"""
+    buffer = _channel_buffers.get(channel_id)
+    if buffer is None:
+        return
+    for i, (buffered_id, author, _) in enumerate(buffer):
+        if buffered_id == message_id:
+            if author is not None:
+                buffer[i] = (message_id, author, _context_line(author, content))
+            return
+
+def forget_messages(channel_id: int, message_ids: set[int]):
+    """Drop deleted messages from their channel's buffer"""
+    buffer = _channel_buffers.get(channel_id)
+    if buffer is not None:
+        _channel_buffers[channel_id] = deque(
+            (entry for entry in buffer if entry[0] not in message_ids), maxlen=_CHANNEL_BUFFER_SIZE
+        )
 
 async def get_channel_context(channel, limit: int = 20) -> List[str]:
     """Get recent messages from channel for context"""
     try:
-        messages = []
-        async for message in channel.history(limit=limit):
-            if not message.author.bot:  # Skip bot messages
-                # Format: "Author: message content"
-                msg_text = f"{message.author.display_name}: {message.content}"
-                messages.append(msg_text)
-        
-        # Reverse to get chronological order (oldest first)
-        return list(reversed(messages))
+        buffer = _channel_buffers.get(channel.id)
+        if buffer is None or _seed_limits.get(channel.id, 0) < limit:
+            # Register an empty buffer first so messages arriving during the fetch are kept
+            arrived = deque(maxlen=_CHANNEL_BUFFER_SIZE)
+            _channel_buffers[channel.id] = arrived
+            history = [_buffer_entry(message) async for message in channel.history(limit=limit)]
+            # History arrives newest first
+            seen = {entry[0] for entry in arrived}
+            buffer = deque((entry for entry in reversed(history) if entry[0] not in seen), maxlen=_CHANNEL_BUFFER_SIZE)
+            buffer.extend(arrived)
+            _channel_buffers[channel.id] = buffer
+            _seed_limits[channel.id] = limit
+        
+        # Chronological order (oldest first)
+        return [line for _, _, line in itertools.islice(buffer, max(len(buffer) - limit, 0), None) if line is not None]
     except Exception as e:
-        logger.error(f"Error getting channel context: {e}")
+        logger.error("Error getting channel context: %s", e)
         return []
 
-async def filter_relevant_context(task_content: str, all_messages: List[str]) -> List[str]:
-    """Use AI to filter only relevant messages from channel context"""
-    if not all_messages or not openai.api_key:
-        return all_messages[:5]  # Fallback to recent messages
+# Exact-match cache of completions, keyed by a hash of model and prompts, so
+# repeated commands and identical contexts don't pay for another round trip
+_COMPLETION_CACHE_SIZE = 1024
+_COMPLETION_CACHE_TTL = 24 * 60 * 60
+_completion_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+def _completion_key(model: str, system_prompt: str, user_prompt: str) -> str:
+    """Hash the inputs that fully determine a completion request"""
+    return hashlib.blake2b(f"{model}\0{system_prompt}\0{user_prompt}".encode(), digest_size=16).hexdigest()
+
+def _cache_get(key: str) -> Optional[str]:
+    """Return a cached completion that is still within its TTL"""
+    entry = _completion_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > _COMPLETION_CACHE_TTL:
+        del _completion_cache[key]
+        return None
+    _completion_cache.move_to_end(key)
+    return entry[1]
+
+def _cache_put(key: str, content: str):
+    """Store a completion, evicting the least recently used one when full"""
+    _completion_cache[key] = (time.monotonic(), content)
+    _completion_cache.move_to_end(key)
+    if len(_completion_cache) > _COMPLETION_CACHE_SIZE:
+        _completion_cache.popitem(last=False)
+
+async def _cached_completion(model: str, system_prompt: str, user_prompt: str, **kwargs) -> str:
+    """Run a chat completion through the exact-match cache and return its text"""
+    key = _completion_key(model, system_prompt, user_prompt)
+    content = _cache_get(key)
+    if content is not None:
+        logger.debug("Completion cache hit for %s", key)
+        return content
     
-    try:
-        messages_text = "\n".join([f"{i+1}. {msg}" for i, msg in enumerate(all_messages)])
-        
-        system_prompt = """You are a context analyzer. Given a task request and recent channel messages, identify which messages are relevant to understanding the task context.
+    response = await openai_client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        **kwargs
+    )
+    content = response.choices[0].message.content
+    _cache_put(key, content)
+    return content
+
+# System prompts are module constants so every request shares a byte-identical
+# prefix that OpenAI can serve from its prompt cache. Anything that varies per
+# call belongs in the trailing user message.
+_FILTER_SYSTEM_PROMPT = """You are a context analyzer. Given a task request and recent channel messages, identify which messages are relevant to understanding the task context.
 
 Rules:
 - Only select messages that provide useful context for the task
@@ -232,6 +530,154 @@ Rules:
 - If no messages are relevant, return "none"
 - Maximum 5 relevant messages"""
 
+_ANALYZE_SYSTEM_PROMPT = """You are a project management assistant. Given a task request and recent channel messages, you select the messages that give useful context for the task and create a concise, actionable task title.
+
+Context selection rules:
+- Only select messages that provide useful context for the task
+- Ignore casual chat, off-topic discussions, or unrelated conversations
+- Look for messages about the same topic, feature, bug, or project area
+- Consider technical discussions, bug reports, feature requests related to the task
+- Maximum 5 relevant messages
+
+Title rules:
+- Keep titles under 60 characters
+- Make them actionable (start with verbs when possible)
+- Be specific and clear
+- The name of the task must be generic - if user sends an error message, the title has to be generalized
+- Focus on the main action or deliverable
+- Don't include "Discord Task:" prefix
+- Use the relevant context to make the title more specific and accurate
+
+Title examples:
+- Review authentication system implementation
+- Fix login bug with special characters
+- Create API documentation for endpoints
+- Update user interface design
+
+Respond with a JSON object of the form {"relevant_indices": [1, 3], "title": "..."} where relevant_indices are the numbers of the relevant messages (an empty list if none are relevant)."""
+
+_INTENT_SYSTEM_PROMPT = """You are an intent classifier for a Discord bot that creates tasks. Your job is to determine whether a user's message is:
+
+1. A COMMAND to create a task (user wants bot to analyze context and create a task)
+2. A TASK DESCRIPTION (user directly describes what the task should be about)
+
+COMMAND examples:
+- "dodaj taska" (Polish: add a task)
+- "create task"
+- "task this"
+- "wrzuć do backlog" (Polish: put in backlog)
+- "zapisz to" (Polish: save this)
+- "task z tego" (Polish: task from this)
+- "możesz stworzyć task?" (Polish: can you create a task?)
+- "task please"
+- "backlog this"
+
+TASK DESCRIPTION examples:
+- "Fix login bug with special characters"
+- "Implement user authentication system"
+- "Review the new authentication system"
+- "Update API documentation"
+- "Create tests for payment module"
+
+Rules:
+- If user is asking the bot to create a task without specifying what it should be about = COMMAND
+- If user is directly describing what needs to be done = TASK DESCRIPTION
+- Commands often contain meta-language about task creation
+- Task descriptions contain specific technical details, actions, or deliverables
+- Consider both Polish and English expressions
+- When in doubt, lean towards TASK DESCRIPTION
+
+Respond with only "COMMAND" or "TASK_DESCRIPTION"."""
+
+# Same rules as _INTENT_SYSTEM_PROMPT, answered for a numbered list in one JSON reply
+_INTENT_BATCH_SYSTEM_PROMPT = _INTENT_SYSTEM_PROMPT.replace(
+    'Respond with only "COMMAND" or "TASK_DESCRIPTION".',
+    'You will receive a numbered list of messages. Classify each one independently and respond with a JSON object '
+    '{"labels": [...]} holding "COMMAND" or "TASK_DESCRIPTION" for every message, in order.'
+)
+
+_EXTRACT_SYSTEM_PROMPT = """You are a smart task creation assistant. The user mentioned a bot with a command to create a task, but didn't specify what the task should be about. You need to analyze the recent conversation context to determine what task should be created.
+
+Rules:
+1. Look at the recent conversation context to understand what needs to be done
+2. Create a clear, actionable task title and description
+3. Focus on the most recent discussion topics or issues mentioned
+4. If there are multiple possible tasks, pick the most recent or urgent one
+5. If the context doesn't provide clear task material, create a task about following up on the discussion
+
+Return your response in this format:
+TITLE: [Clear, actionable task title]
+DESCRIPTION: [Brief description of what needs to be done based on context]"""
+
+_TASK_MATCH_SYSTEM_PROMPT = """You are a task matching assistant. Given a task description and a list of existing tasks, find the most semantically similar task.
+
+Rules:
+- Look for semantic similarity, not just exact word matches
+- Consider synonyms, related concepts, and context
+- Focus on the main purpose/goal of the task
+- If no task is reasonably similar, return "none"
+- Return only the number of the most similar task (e.g., "3")"""
+
+_MEMBER_MATCH_SYSTEM_PROMPT = """You are an expert at matching names and usernames. Given a partial name or nickname, find the best matching ClickUp team member.
+
+Matching rules:
+- Look for exact matches first
+- Then check for partial matches (e.g., "kowal" matches "jan.kowalski")
+- Consider common name variations (dots, underscores, dashes)
+- Match fragments of usernames or emails
+- Consider both first name and last name parts
+- Be flexible with partial queries (e.g., "john" can match "john.doe" or "johnsmith")
+- If multiple matches are possible, prefer the most specific/exact match
+
+Examples:
+- "kowal" → "jan.kowalski" (partial last name)
+- "john" → "john.doe" (first name)
+- "smith" → "johnsmith" or "john.smith" (last name part)
+- "jdoe" → "john.doe" (username pattern)
+
+Return only the number of the best match or 'none' if no reasonable match exists."""
+
+# Tasks this short, or channels this quiet, don't gain anything from AI context selection
+_MIN_AI_TASK_CHARS = 30
+_MIN_AI_CONTEXT_MESSAGES = 3
+# Words short or common enough to appear in nearly every message don't count as overlap
+_TOKEN_RE = re.compile(r'\w{4,}')
+_STOPWORDS = frozenset({
+    'this', 'that', 'with', 'have', 'from', 'what', 'when', 'will', 'would', 'should', 'could',
+    'there', 'their', 'about', 'just', 'like', 'also', 'some', 'make', 'need', 'please',
+    'jest', 'będzie', 'żeby', 'tego', 'może', 'mamy', 'trzeba', 'proszę',
+})
+
+def _content_words(text: str) -> set[str]:
+    """Lowercased words of four or more letters, minus stopwords"""
+    return set(_TOKEN_RE.findall(text.lower())) - _STOPWORDS
+
+def _overlapping_messages(task_content: str, all_messages: List[str]) -> List[str]:
+    """Keep only messages sharing at least one content word with the task request"""
+    task_words = _content_words(task_content)
+    return [m for m in all_messages if not task_words.isdisjoint(_content_words(m))]
+
+def _prefilter_context(task_content: str, all_messages: List[str]) -> Optional[List[str]]:
+    """Cheap heuristic pass; returns the context when no AI call is needed, otherwise None"""
+    if len(task_content) < _MIN_AI_TASK_CHARS or len(all_messages) <= _MIN_AI_CONTEXT_MESSAGES:
+        return all_messages[-3:]
+    if not _overlapping_messages(task_content, all_messages):
+        return []
+    return None
+
+async def filter_relevant_context(task_content: str, all_messages: List[str]) -> List[str]:
+    """Use AI to filter only relevant messages from channel context"""
+    if not all_messages or openai_client is None:
+        return all_messages[:5]  # Fallback to recent messages
+    
+    prefiltered = _prefilter_context(task_content, all_messages)
+    if prefiltered is not None:
+        logger.debug("Skipped AI context filtering, kept %d messages", len(prefiltered))
+        return prefiltered
+    
+    try:
+        messages_text = _number_messages(all_messages)
+
         user_prompt = f"""Task request: "{task_content}"
 
 Recent channel messages:
@@ -239,17 +685,8 @@ Recent channel messages:
 
 Which message numbers are relevant to this task? Return only numbers separated by commas (e.g., "1,3,5") or "none":"""
 
-        response = openai.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=50,
-            temperature=0.3
-        )
-        
-        result = response.choices[0].message.content.strip().lower()
+        content = await _cached_completion(_FAST_MODEL, _FILTER_SYSTEM_PROMPT, user_prompt, max_tokens=50, temperature=0.3)
+        result = content.strip().lower()
         
         if result == "none":
             logger.info("AI determined no messages are relevant to task context")
@@ -260,108 +697,242 @@ Which message numbers are relevant to this task? Return only numbers separated b
             relevant_indices = [int(x.strip()) - 1 for x in result.split(',') if x.strip().isdigit()]
             relevant_messages = [all_messages[i] for i in relevant_indices if 0 <= i < len(all_messages)]
             
-            logger.info(f"AI selected {len(relevant_messages)} relevant messages from {len(all_messages)} total")
+            logger.info("AI selected %d relevant messages from %d total", len(relevant_messages), len(all_messages))
             return relevant_messages[:5]  # Limit to 5 messages
             
         except (ValueError, IndexError) as e:
-            logger.warning(f"Could not parse AI response for context filtering: {e}")
+            logger.warning("Could not parse AI response for context filtering: %s", e)
             return all_messages[:3]  # Fallback
         
     except Exception as e:
-        logger.error(f"Error filtering relevant context: {e}")
+        logger.error("Error filtering relevant context: %s", e)
         return all_messages[:3]  # Fallback to recent messages
 
-async def generate_smart_title(task_content: str, relevant_context: List[str]) -> str:
-    """Generate intelligent task title using OpenAI with filtered context"""
+def _fallback_title(task_content: str) -> str:
+    """Build a plain title from the task request when AI titling is unavailable"""
+    # Cut on a word boundary; a single over-long word would shorten to just the placeholder
+    title = textwrap.shorten(task_content, width=53, placeholder="...")
+    if title in ("", "...") and task_content:
+        return f"{task_content[:50]}{'...' if len(task_content) > 50 else ''}"
+    # Don't leave a dangling "application;..." where the cut landed after punctuation
+    if title.endswith("...") and len(title) < len(task_content):
+        return f"{title[:-3].rstrip(',;:.!?-')}..."
+    return title
+
+# Most inputs the embeddings endpoint accepts in a single request
+_EMBEDDING_BATCH_SIZE = 2048
+
+async def _embed_texts(texts: List[str]) -> Optional[np.ndarray]:
+    """Embed texts as rows of L2-normalized float32 vectors, one request per 2048 inputs; None if it fails"""
+    embeddings = []
     try:
-        # Prepare context
-        context_text = "\n".join(relevant_context) if relevant_context else ""
-        
-        system_prompt = """You are a helpful assistant that creates concise, actionable task titles for project management.
-        
-        Rules:
-        - Keep titles under 60 characters
-        - Make them actionable (start with verbs when possible)
-        - Be specific and clear
-        - The name of the task must be generic - if user sends an error message, the title has to be generalized
-        - Focus on the main action or deliverable
-        - Don't include "Discord Task:" prefix
-        - Use the relevant context to make the title more specific and accurate
-        
-        Examples:
-        - Review authentication system implementation
-        - Fix login bug with special characters
-        - Create API documentation for endpoints
-        - Update user interface design
-        """
-        
-        context_section = f"\n\nRelevant context from recent discussion:\n{context_text}" if context_text else ""
+        for start in range(0, len(texts), _EMBEDDING_BATCH_SIZE):
+            response = await openai_client.embeddings.create(
+                model=_EMBEDDING_MODEL,
+                input=texts[start:start + _EMBEDDING_BATCH_SIZE]
+            )
+            embeddings.extend(item.embedding for item in response.data)
+    except openai.OpenAIError as e:
+        logger.warning("Embedding request failed: %s", e)
+        return None
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+async def _embed_text(text: str) -> Optional[np.ndarray]:
+    """Embed a single text as an L2-normalized float32 vector"""
+    vectors = await _embed_texts([text])
+    return None if vectors is None else vectors[0]
+
+class SemanticTitleCache:
+    """Reuse titles generated for near-duplicate task requests, matched by embedding similarity"""
+    
+    def __init__(self, threshold: float = 0.92, max_entries: int = 2048):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Optional[np.ndarray] = None  # (n, dim) matrix of unit vectors
+        self._titles: List[str] = []
+        self._last_used: List[int] = []
+        self._clock = 0
+    
+    def lookup(self, vector: np.ndarray) -> Optional[str]:
+        """Return the cached title most similar to vector if it clears the threshold"""
+        if self._vectors is None:
+            return None
+        scores = self._vectors @ vector
+        best = int(scores.argmax())
+        if scores[best] < self.threshold:
+            return None
+        self._clock += 1
+        self._last_used[best] = self._clock
+        return self._titles[best]
+    
+    def add(self, vector: np.ndarray, title: str):
+        """Remember a title, evicting the least recently used entry when full"""
+        self._clock += 1
+        if self._vectors is None:
+            self._vectors = vector[np.newaxis, :].copy()
+        elif len(self._titles) >= self.max_entries:
+            oldest = self._last_used.index(min(self._last_used))
+            self._vectors[oldest] = vector
+            self._titles[oldest] = title
+            self._last_used[oldest] = self._clock
+            return
+        else:
+            self._vectors = np.vstack([self._vectors, vector])
+        self._titles.append(title)
+        self._last_used.append(self._clock)
+
+_title_cache = SemanticTitleCache()
+
+async def analyze_task_request(task_content: str, all_messages: List[str]) -> tuple[List[str], str]:
+    """Filter relevant channel context and generate a task title in a single AI call
+    
+    Returns:
+        tuple: (relevant_messages, title)
+    """
+    if openai_client is None:
+        return all_messages[:5], _fallback_title(task_content)
+    
+    # Only offer the model messages that share a word with the request
+    short_request = len(task_content) < _MIN_AI_TASK_CHARS
+    if short_request or len(all_messages) > _MIN_AI_CONTEXT_MESSAGES:
+        all_messages = _overlapping_messages(task_content, all_messages)
+    
+    try:
+        # A short request gives too little to judge relevance by, so the model only titles it
+        messages_text = ("" if short_request else _number_messages(all_messages)) or "(no messages)"
         
-        user_prompt = f"""Based on this task request: "{task_content}"{context_section}
+        user_prompt = f"""Task request: "{task_content}"
+
+Recent channel messages:
+{messages_text}"""
         
-        Generate a concise, actionable task title:"""
+        cache_key = _completion_key(_FAST_MODEL, _ANALYZE_SYSTEM_PROMPT, user_prompt)
+        content = _cache_get(cache_key)
+        embedding = None
+        if content is not None:
+            result = orjson.loads(content)
+        else:
+            # A near-duplicate request (same ask, slightly different wording) reuses its title.
+            # Only the request is embedded, since channel history is shared between requests,
+            # and the completion starts alongside so a miss doesn't wait on the embedding
+            embedding, stream = await asyncio.gather(
+                _embed_text(task_content),
+                openai_client.chat.completions.create(
+                    model=_FAST_MODEL,
+                    response_format={"type": "json_object"},
+                    messages=[
+                        {"role": "system", "content": _ANALYZE_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    max_tokens=120,
+                    temperature=0.3,
+                    stream=True
+                )
+            )
+            cached_title = _title_cache.lookup(embedding) if embedding is not None else None
+            if cached_title is not None:
+                await stream.close()
+                logger.info("Reusing title of a near-duplicate request: %s", cached_title)
+                return await filter_relevant_context(task_content, all_messages), cached_title
+            
+            # Stop reading as soon as the JSON object is complete instead of
+            # waiting for the rest of the token budget (JSON mode may pad with whitespace)
+            content = ""
+            result = None
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    content += delta
+                    if "}" in delta:
+                        try:
+                            result = orjson.loads(content)
+                            break
+                        except orjson.JSONDecodeError:
+                            pass
+            finally:
+                await stream.close()
+            
+            if result is None:
+                result = orjson.loads(content)
+            _cache_put(cache_key, content)
         
-        response = openai.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=50,
-            temperature=0.7
-        )
+        relevant_indices = [int(x) - 1 for x in result.get("relevant_indices", []) if str(x).isdigit()]
+        if short_request:
+            relevant_messages = all_messages[-3:]
+        else:
+            relevant_messages = [all_messages[i] for i in relevant_indices if 0 <= i < len(all_messages)][:5]
+            logger.info("AI selected %d relevant messages from %d total", len(relevant_messages), len(all_messages))
         
-        generated_title = response.choices[0].message.content.strip()
+        # Fallback if the generated title is empty or too long
+        title = str(result.get("title") or "").strip()
+        if not title or len(title) > 80:
+            title = _fallback_title(task_content)
         
-        # Fallback if OpenAI response is empty or too long
-        if not generated_title or len(generated_title) > 80:
-            return f"{task_content[:50]}{'...' if len(task_content) > 50 else ''}"
+        if embedding is not None:
+            _title_cache.add(embedding, title)
         
-        return generated_title
+        return relevant_messages, title
         
     except Exception as e:
-        logger.error(f"Error generating smart title: {e}")
-        # Fallback to simple title
-        return f"{task_content[:50]}{'...' if len(task_content) > 50 else ''}"
+        logger.error("Error analyzing task request: %s", e)
+        return all_messages[:3], _fallback_title(task_content)
 
-def determine_target_list(message_content: str) -> tuple[Optional[str], str]:
+# Matches "backlog" anywhere in a message without lowercasing a copy of it
+_BACKLOG_RE = re.compile(r'backlog', re.IGNORECASE)
+
+async def determine_target_list(message_content: str) -> tuple[Optional[str], str]:
     """Determine which list to add the task to based on message content
     
     Returns:
         tuple: (list_id, list_description)
     """
     # Check if "backlog" appears in the message (case-insensitive)
-    if "backlog" in message_content.lower():
+    if _BACKLOG_RE.search(message_content):
         logger.info("Message contains 'backlog' - routing to backlog list")
         return None, "📋 Backlog"  # None means use default backlog list
     else:
         logger.info("Message doesn't contain 'backlog' - looking for newest sprint list")
         # Get newest list from sprint folder
-        newest_list = clickup_client.get_newest_list_from_folder()
+        newest_list = await bot.clickup.get_newest_list_from_folder()
         if newest_list:
             list_name = newest_list.get('name', 'Current Sprint')
             list_id = newest_list.get('id')
-            logger.info(f"Found newest sprint list: {list_name} (ID: {list_id})")
+            logger.info("Found newest sprint list: %s (ID: %s)", list_name, list_id)
             return list_id, f"🚀 {list_name}"
         else:
             logger.warning("No lists found in folder, falling back to backlog")
             return None, "📋 Backlog (fallback)"
 
+# Matches both mention forms of the bot user (<@id> and <@!id>); built in on_ready
+_MENTION_RE: Optional[re.Pattern] = None
+# Bot user ID, cached in on_ready so mention checks compare plain ints
+_BOT_USER_ID: Optional[int] = None
+
 @bot.event
 async def on_ready():
     """Called when the bot is ready"""
-    logger.info(f'{bot.user} has connected to Discord!')
-    logger.info(f'Bot is in {len(bot.guilds)} guilds')
-    logger.info(f"Registered commands: {[cmd.name for cmd in bot.commands]}")
+    global _MENTION_RE, _BOT_USER_ID
+    _BOT_USER_ID = bot.user.id
+    _MENTION_RE = re.compile(rf'<@!?{_BOT_USER_ID}>')
+    logger.info('%s has connected to Discord!', bot.user)
+    logger.info('Bot is in %d guilds', len(bot.guilds))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Registered commands: %s", [cmd.name for cmd in bot.commands])
     try:
         await bot.tree.sync()
         logger.info("Slash commands synced")
     except Exception as e:
-        logger.error(f"Error syncing commands: {e}")
+        logger.error("Error syncing commands: %s", e)
     
     # Test folder connection
-    lists = clickup_client.get_folder_lists()
-    logger.info(f"Found {len(lists)} lists in sprint folder")
+    lists = await bot.clickup.get_folder_lists()
+    logger.info("Found %d lists in sprint folder", len(lists))
     
     # Set bot status
     await bot.change_presence(
@@ -374,22 +945,101 @@ async def on_ready():
 @bot.event
 async def on_message(message):
     """Handle incoming messages"""
-    logger.info(f"Received message: {message.content}")
-    # Ignore messages from the bot itself
-    if message.author == bot.user:
+    remember_message(message)
+    
+    # Ignore bots (including this one); process_commands would drop them anyway
+    if message.author.bot:
         return
     
-    logger.info(f"user.id: {bot.user.id}")
-    logger.info(f"Message starts with prefix: {message.content.startswith(bot.command_prefix)}")
-    logger.info(f"Bot mentioned: {bot.user in message.mentions}")
+    # Prefixed messages are commands (!help, !status, !health) and never create tasks
+    if message.content.startswith(bot.command_prefix):
+        await bot.process_commands(message)
+        return
     
-    # Process commands first (this handles !help, !status, !health)
-    await bot.process_commands(message)
+    if message.mentions and any(m.id == _BOT_USER_ID for m in message.mentions):
+        await enqueue_task_creation(message)
+
+@bot.event
+async def on_raw_message_edit(payload):
+    """Keep an edited message's buffered line in step with its text"""
+    # Updates without content (link previews, embeds) leave the text as it was
+    if "content" in payload.data:
+        update_buffered_message(payload.channel_id, payload.message_id, payload.data["content"])
+
+@bot.event
+async def on_raw_message_delete(payload):
+    """Drop a deleted message from the channel's buffered context"""
+    forget_messages(payload.channel_id, {payload.message_id})
+
+@bot.event
+async def on_raw_bulk_message_delete(payload):
+    """Drop bulk-deleted messages from the channel's buffered context"""
+    forget_messages(payload.channel_id, payload.message_ids)
+
+_BUSY_REPLY = "❌ I'm busy creating other tasks, please try again in a moment."
+
+async def enqueue_task_creation(message):
+    """Acknowledge a task request right away and hand it to the task workers"""
+    if task_queue.full():
+        await message.reply(_BUSY_REPLY)
+        return
+    ack = await message.reply("⏳ Queued, creating your task...")
+    try:
+        task_queue.put_nowait((message, ack))
+    except asyncio.QueueFull:
+        # Other requests filled the queue while the acknowledgement was being sent
+        await ack.edit(content=_BUSY_REPLY)
+
+async def task_worker():
+    """Create queued tasks one at a time, editing each acknowledgement with the result"""
+    while True:
+        message, ack = await task_queue.get()
+        try:
+            await handle_task_creation(message, ack)
+        except Exception as e:
+            logger.error("Task worker failed: %s", e)
+        finally:
+            task_queue.task_done()
+
+# Known short "make a task out of this" phrasings (Polish and English); these skip the AI classifier.
+# The phrase has to be the whole message, give or take filler words, so "create task templates"
+# still reaches the model
+_COMMAND_RE = re.compile(
+    r'(?:(?:please|pls|proszę|prosze)\s+)?'
+    r'(?:dodaj\s+task\w*|stw[oó]rz\s+task\w*|(?:create|add)\s+(?:a\s+)?task|task\s+(?:this|it|from\s+this)'
+    r'|task\s+z\s+tego|backlog\s+this|wrzu[cć]\s+(?:to\s+)?do\s+backlog\w*|zapisz\s+to|task\s+please'
+    r'|mo[zż]esz\s+stworzy[cć]\s+task\w*|taska?)'
+    r'(?:\s+(?:please|pls|proszę|prosze|this|to|it))*[\s?!.]*',
+    re.IGNORECASE
+)
+_MAX_COMMAND_WORDS = 6
+# The most common whole-message commands, matched before any regex
+_EXACT_COMMANDS = frozenset({"task", "taska", "dodaj taska", "dodaj task", "stwórz task", "create task", "add task"})
+# Messages opening with a concrete engineering verb describe the work themselves
+_DESCRIPTION_RE = re.compile(
+    r'^(?:fix|implement|refactor|debug|napraw|zaimplementuj|popraw|zrefaktoryzuj)\s+\S',
+    re.IGNORECASE
+)
+
+def _quick_intent(content_cleaned: str, word_count: int, content_lower: str) -> Optional[bool]:
+    """Settle obvious commands and task descriptions without AI; None when the model has to decide"""
+    if content_lower in _EXACT_COMMANDS:
+        return True
+    
+    # A leading engineering verb wins over any command phrase later in the message
+    if _DESCRIPTION_RE.match(content_cleaned):
+        return False
     
-    # Only check for task creation if message doesn't start with command prefix
-    # and the bot is mentioned
-    if not message.content.startswith(bot.command_prefix) and bot.user in message.mentions:
-        await handle_task_creation(message)
+    # Short messages matching a known command phrase need no AI call
+    if word_count <= _MAX_COMMAND_WORDS and _COMMAND_RE.fullmatch(content_cleaned):
+        return True
+    
+    # Quick heuristic for very obvious task descriptions (performance optimization)
+    # If message is long and technical, it's likely a task description
+    if word_count > 10 and any(word in content_lower for word in ['implement', 'fix', 'create', 'update', 'review', 'add', 'remove', 'delete', 'bug', 'feature', 'system', 'api', 'database', 'interface']):
+        return False
+    
+    return None
 
 async def is_task_creation_command(content: str) -> bool:
     """Use AI to determine if the message is a command to create a task rather than a task description"""
@@ -399,112 +1049,91 @@ async def is_task_creation_command(content: str) -> bool:
     if not content_cleaned:
         return False
     
-    # Quick heuristic for very obvious task descriptions (performance optimization)
-    # If message is long and technical, it's likely a task description
-    if len(content_cleaned.split()) > 10 and any(word in content_cleaned.lower() for word in ['implement', 'fix', 'create', 'update', 'review', 'add', 'remove', 'delete', 'bug', 'feature', 'system', 'api', 'database', 'interface']):
-        return False
+    # Tokenize and lowercase once; every heuristic below reuses these
+    word_count = len(content_cleaned.split())
+    content_lower = content_cleaned.lower()
+    
+    quick_result = _quick_intent(content_cleaned, word_count, content_lower)
+    if quick_result is not None:
+        return quick_result
     
     # Use AI for intent analysis
-    if not openai.api_key:
+    if openai_client is None:
         logger.warning("OpenAI API key not available, falling back to simple heuristics")
         # Simple fallback: very short messages with task-related words are likely commands
         simple_command_words = ['task', 'taska', 'zadanie', 'backlog']
-        return len(content_cleaned.split()) <= 3 and any(word in content_cleaned.lower() for word in simple_command_words)
+        return word_count <= 3 and any(word in content_lower for word in simple_command_words)
     
     try:
-        system_prompt = """You are an intent classifier for a Discord bot that creates tasks. Your job is to determine whether a user's message is:
-
-1. A COMMAND to create a task (user wants bot to analyze context and create a task)
-2. A TASK DESCRIPTION (user directly describes what the task should be about)
-
-COMMAND examples:
-- "dodaj taska" (Polish: add a task)
-- "create task"
-- "task this"
-- "wrzuć do backlog" (Polish: put in backlog)
-- "zapisz to" (Polish: save this)
-- "task z tego" (Polish: task from this)
-- "możesz stworzyć task?" (Polish: can you create a task?)
-- "task please"
-- "backlog this"
-
-TASK DESCRIPTION examples:
-- "Fix login bug with special characters"
-- "Implement user authentication system"
-- "Review the new authentication system"
-- "Update API documentation"
-- "Create tests for payment module"
-
-Rules:
-- If user is asking the bot to create a task without specifying what it should be about = COMMAND
-- If user is directly describing what needs to be done = TASK DESCRIPTION
-- Commands often contain meta-language about task creation
-- Task descriptions contain specific technical details, actions, or deliverables
-- Consider both Polish and English expressions
-- When in doubt, lean towards TASK DESCRIPTION
-
-Respond with only "COMMAND" or "TASK_DESCRIPTION"."""
-
         user_prompt = f'Analyze this message: "{content_cleaned}"'
 
-        response = openai.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=10,
-            temperature=0.1
-        )
-        
-        result = response.choices[0].message.content.strip().upper()
+        content = await _cached_completion(_FAST_MODEL, _INTENT_SYSTEM_PROMPT, user_prompt, max_tokens=10, temperature=0.1)
+        result = content.strip().upper()
         
         is_command = result == "COMMAND"
-        logger.info(f"AI intent analysis: '{content_cleaned}' -> {result} -> {'COMMAND' if is_command else 'TASK_DESCRIPTION'}")
+        logger.info("AI intent analysis: '%s' -> %s -> %s", content_cleaned, result, 'COMMAND' if is_command else 'TASK_DESCRIPTION')
         
         return is_command
         
     except Exception as e:
-        logger.error(f"Error in AI intent analysis: {e}")
+        logger.error("Error in AI intent analysis: %s", e)
         # Fallback to simple heuristics
         simple_command_words = ['task', 'taska', 'zadanie', 'backlog', 'dodaj', 'stwórz', 'create', 'add']
-        is_simple_command = len(content_cleaned.split()) <= 5 and any(word in content_cleaned.lower() for word in simple_command_words)
-        logger.info(f"Fallback heuristic: '{content_cleaned}' -> {'COMMAND' if is_simple_command else 'TASK_DESCRIPTION'}")
+        is_simple_command = word_count <= 5 and any(word in content_lower for word in simple_command_words)
+        logger.info("Fallback heuristic: '%s' -> %s", content_cleaned, 'COMMAND' if is_simple_command else 'TASK_DESCRIPTION')
         return is_simple_command
 
-async def extract_task_from_context(message, command_content: str) -> tuple[str, str]:
-    """Extract task information from channel context when a command is detected"""
-    logger.info(f"Command detected: '{command_content}' - analyzing context for task content")
+async def is_task_creation_command_batch(contents: List[str]) -> List[bool]:
+    """Classify many messages with a single completion; same fast paths and fallbacks as is_task_creation_command"""
+    results: List[Optional[bool]] = []
+    pending = []
+    for content in contents:
+        content_cleaned = content.strip()
+        if not content_cleaned:
+            results.append(False)
+            continue
+        results.append(_quick_intent(content_cleaned, len(content_cleaned.split()), content_cleaned.lower()))
+        if results[-1] is None:
+            pending.append(len(results) - 1)
     
-    # Get recent channel messages for context
-    all_channel_messages = await get_channel_context(message.channel, limit=15)
+    if not pending:
+        return results
+    
+    labels = None
+    if openai_client is not None:
+        numbered = "\n".join(f'{n}. "{contents[i].strip()}"' for n, i in enumerate(pending, 1))
+        try:
+            content = await _cached_completion(
+                _FAST_MODEL, _INTENT_BATCH_SYSTEM_PROMPT, f"Analyze these messages:\n{numbered}",
+                response_format={"type": "json_object"}, temperature=0.1
+            )
+            labels = orjson.loads(content).get("labels")
+        except (openai.OpenAIError, orjson.JSONDecodeError, AttributeError, TypeError) as e:
+            logger.error("Error in batched AI intent analysis: %s", e)
+    
+    if not isinstance(labels, list) or len(labels) != len(pending):
+        # One message at a time keeps each message's own fallback behaviour
+        labels = await asyncio.gather(*(is_task_creation_command(contents[i]) for i in pending))
+    else:
+        labels = [str(label).strip().upper() == "COMMAND" for label in labels]
+    
+    for i, is_command in zip(pending, labels):
+        results[i] = is_command
+    return results
+
+async def extract_task_from_context(command_content: str, all_channel_messages: List[str]) -> tuple[str, str]:
+    """Extract task information from the recent channel messages when a command is detected"""
+    logger.info("Command detected: '%s' - analyzing context for task content", command_content)
     
     # Use AI to determine what task should be created from the context
-    if not openai.api_key:
+    if openai_client is None:
         logger.warning("OpenAI API key not available, using fallback method")
         return "Task from conversation context", "No AI analysis available"
     
     try:
         # Prepare context for AI analysis
-        context_text = ""
-        if all_channel_messages:
-            context_text = "\n".join([
-                f"{msg}" for msg in all_channel_messages
-            ])
+        context_text = "\n".join(all_channel_messages)
         
-        system_prompt = """You are a smart task creation assistant. The user mentioned a bot with a command to create a task, but didn't specify what the task should be about. You need to analyze the recent conversation context to determine what task should be created.
-
-Rules:
-1. Look at the recent conversation context to understand what needs to be done
-2. Create a clear, actionable task title and description
-3. Focus on the most recent discussion topics or issues mentioned
-4. If there are multiple possible tasks, pick the most recent or urgent one
-5. If the context doesn't provide clear task material, create a task about following up on the discussion
-
-Return your response in this format:
-TITLE: [Clear, actionable task title]
-DESCRIPTION: [Brief description of what needs to be done based on context]"""
-
         user_prompt = f"""The user said: "{command_content}"
 
 Recent conversation context:
@@ -512,18 +1141,43 @@ Recent conversation context:
 
 What task should be created based on this context?"""
 
-        response = openai.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            max_tokens=300,
-            temperature=0.3
-        )
-        
-        ai_response = response.choices[0].message.content
-        logger.info(f"AI task analysis: {ai_response}")
+        cache_key = _completion_key(_SMART_MODEL, _EXTRACT_SYSTEM_PROMPT, user_prompt)
+        ai_response = _cache_get(cache_key)
+        if ai_response is None:
+            stream = await openai_client.chat.completions.create(
+                model=_SMART_MODEL,
+                messages=[
+                    {"role": "system", "content": _EXTRACT_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                max_tokens=300,
+                temperature=0.3,
+                stream=True
+            )
+            
+            # Surface the title as soon as its line is complete and stop once the
+            # DESCRIPTION line has ended; anything after it is never parsed
+            ai_response = ""
+            title_logged = False
+            try:
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if not delta:
+                        continue
+                    ai_response += delta
+                    if "\n" in delta:
+                        completed = ai_response.rsplit('\n', 1)[0]
+                        if not title_logged and 'TITLE:' in completed:
+                            logger.info("AI task title ready, waiting for description")
+                            title_logged = True
+                        if 'DESCRIPTION:' in completed:
+                            break
+            finally:
+                await stream.close()
+            _cache_put(cache_key, ai_response)
+        logger.info("AI task analysis: %s", ai_response)
         
         # Parse the AI response
         lines = ai_response.split('\n')
@@ -539,12 +1193,61 @@ What task should be created based on this context?"""
         return title, description
         
     except Exception as e:
-        logger.error(f"Error analyzing context with AI: {e}")
+        logger.error("Error analyzing context with AI: %s", e)
         # Fallback: use command content
         return "Task from conversation context", command_content
 
-async def handle_task_creation(message):
+# Layout of the ClickUp task description, filled in once per task
+_DESCRIPTION_TEMPLATE = (
+    "**Task created from Discord**\n"
+    "\n"
+    "{message_lines}\n"
+    "\n"
+    "**Target List:** {target_list}\n"
+    "**Author:** {author_display} ({author_name}#{author_disc})\n"
+    "**Channel:** #{channel}\n"
+    "**Guild:** {guild}\n"
+    "**Timestamp:** {ts}\n"
+    "**Message Link:** {url}"
+    "{context}"
+)
+
+# Static part of the task-created reply; per-task fields are merged in by handle_task_creation
+_SUCCESS_EMBED = {
+    "title": "✅ Task Created Successfully!",
+    "description": "I've created a new task in ClickUp with AI-generated title and smart context analysis.",
+    "color": discord.Color.green().value,
+}
+
+# Shells for the error replies; only the description and timestamp vary
+_CREATE_ERROR_EMBED = {"title": "❌ Error Creating Task", "color": discord.Color.red().value}
+_UPDATE_ERROR_EMBED = {"title": "❌ Error Updating Task", "color": discord.Color.red().value}
+
+async def _respond(message, ack, content: Optional[str] = None, embed: Optional[discord.Embed] = None):
+    """Reply to the message, or replace the queued acknowledgement if there is one"""
+    if ack is not None:
+        await ack.edit(content=content, embed=embed)
+    elif embed is not None:
+        await message.reply(embed=embed)
+    else:
+        await message.reply(content)
+
+# Repeat mentions with the same text from the same author inside this window are
+# treated as retries; entries map (author id, content hash) -> (time, task URL)
+_DEDUP_WINDOW = 60
+_DEDUP_MAX_ENTRIES = 1000
+_recent_tasks: dict[tuple[int, int], tuple[float, Optional[str]]] = {}
+
+def _prune_recent_tasks(now: float):
+    """Drop dedup entries well past the window once the table grows"""
+    if len(_recent_tasks) < _DEDUP_MAX_ENTRIES:
+        return
+    for key in [k for k, (ts, _) in _recent_tasks.items() if now - ts > 2 * _DEDUP_WINDOW]:
+        del _recent_tasks[key]
+
+async def handle_task_creation(message, ack: Optional[discord.Message] = None):
     """Handle creating a ClickUp task from a Discord message"""
+    dedup_key = None
     try:
         # Send typing indicator
         async with message.channel.typing():
@@ -552,12 +1255,30 @@ async def handle_task_creation(message):
             content = message.content
             
             # Remove bot mention from content
-            clean_content = content.replace(f'<@{bot.user.id}>', '').strip()
-            clean_content = clean_content.replace(f'<@!{bot.user.id}>', '').strip()
+            mention_re = _MENTION_RE or re.compile(rf'<@!?{bot.user.id}>')
+            clean_content = mention_re.sub('', content).strip()
             
             if not clean_content:
-                await message.reply("❌ Please provide a task description when mentioning me!")
+                await _respond(message, ack, "❌ Please provide a task description when mentioning me!")
+                return
+            
+            # Skip retries of a task this author just asked for
+            now = time.monotonic()
+            dedup_key = (message.author.id, hash(clean_content))
+            recent = _recent_tasks.get(dedup_key)
+            if recent is not None and now - recent[0] < _DEDUP_WINDOW:
+                dedup_key = None  # Leave the original entry alone
+                duplicate_of = f": {recent[1]}" if recent[1] else "."
+                await _respond(message, ack, f"⚠️ You just asked for this task, so I skipped the duplicate{duplicate_of}")
                 return
+            _prune_recent_tasks(now)
+            _recent_tasks[dedup_key] = (now, None)
+            
+            # Fetch channel context and resolve the target list in the background
+            # while the message is being classified
+            logger.info("Getting channel context and target list...")
+            context_task = asyncio.create_task(get_channel_context(message.channel, limit=20))
+            list_task = asyncio.create_task(determine_target_list(clean_content))
             
             # Check if this is a command to create a task vs. a task description
             is_command = await is_task_creation_command(clean_content)
@@ -565,7 +1286,8 @@ async def handle_task_creation(message):
             if is_command:
                 # Extract task from context using AI
                 logger.info("Detected task creation command - analyzing context")
-                task_name, task_description_from_context = await extract_task_from_context(message, clean_content)
+                all_channel_messages = await context_task
+                task_name, task_description_from_context = await extract_task_from_context(clean_content, all_channel_messages[-15:])
                 
                 # For commands, we use the AI-generated title directly and don't need additional title generation
                 final_task_name = task_name
@@ -575,86 +1297,73 @@ async def handle_task_creation(message):
                 task_input_content = clean_content
                 final_task_name = None  # Will be generated later
             
-            # Determine target list based on message content
-            target_list_id, list_description = determine_target_list(clean_content)
-            logger.info(f"Target list: {list_description} (ID: {target_list_id})")
-            
-            # Get channel context for smarter title generation (if needed)
-            logger.info("Getting channel context...")
-            all_channel_messages = await get_channel_context(message.channel, limit=20)
+            all_channel_messages, (target_list_id, list_description) = await asyncio.gather(context_task, list_task)
+            logger.info("Target list: %s (ID: %s)", list_description, target_list_id)
             
-            # Filter for relevant context using AI
-            logger.info("Filtering relevant context with AI...")
-            relevant_context = await filter_relevant_context(task_input_content, all_channel_messages)
-            
-            # Generate smart title using OpenAI with filtered context (only if not already generated)
             if final_task_name is None:
-                logger.info("Generating smart title with relevant context...")
-                final_task_name = await generate_smart_title(task_input_content, relevant_context)
+                # Filter for relevant context and generate the title in one AI call
+                logger.info("Filtering relevant context and generating smart title with AI...")
+                relevant_context, final_task_name = await analyze_task_request(task_input_content, all_channel_messages)
             else:
-                logger.info(f"Using AI-generated title from context analysis: {final_task_name}")
+                # Filter for relevant context using AI
+                logger.info("Filtering relevant context with AI...")
+                relevant_context = await filter_relevant_context(task_input_content, all_channel_messages)
+                logger.info("Using AI-generated title from context analysis: %s", final_task_name)
+            
+            # Different description format for commands vs direct descriptions
+            if is_command:
+                original_message_lines = [
+                    f"**Command:** {clean_content}",
+                    f"**Extracted from context:** {task_description_from_context}",
+                ]
+            else:
+                original_message_lines = [f"**Original Message:** {clean_content}"]
             
             # Prepare context summary for task description
-            context_summary = ""
             if relevant_context:
-                context_summary = f"\n\n**Relevant Context from Channel:**\n"
-                context_summary += "\n".join([f"• {msg}" for msg in relevant_context])
+                context_lines = ["", "**Relevant Context from Channel:**", *(f"• {msg}" for msg in relevant_context)]
             elif all_channel_messages:
-                context_summary = f"\n\n**Note:** AI found no relevant context in recent {len(all_channel_messages)} messages"
-            
-            # Different description format for commands vs direct descriptions
-            if is_command:
-                original_message_section = f"**Command:** {clean_content}\n**Extracted from context:** {task_description_from_context}"
+                context_lines = ["", f"**Note:** AI found no relevant context in recent {len(all_channel_messages)} messages"]
             else:
-                original_message_section = f"**Original Message:** {clean_content}"
+                context_lines = []
             
-            task_description = f"""
-**Task created from Discord**
-
-{original_message_section}
-
-**Target List:** {list_description}
-**Author:** {message.author.display_name} ({message.author.name}#{message.author.discriminator})
-**Channel:** #{message.channel.name}
-**Guild:** {message.guild.name if message.guild else 'DM'}
-**Timestamp:** {message.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}
-**Message Link:** {message.jump_url}{context_summary}
-            """.strip()
+            author = message.author
+            guild = message.guild
+            task_description = _DESCRIPTION_TEMPLATE.format(
+                message_lines="\n".join(original_message_lines),
+                target_list=list_description,
+                author_display=author.display_name,
+                author_name=author.name,
+                author_disc=author.discriminator,
+                channel=message.channel.name,
+                guild=guild.name if guild else 'DM',
+                ts=message.created_at.isoformat(sep=' ', timespec='seconds'),
+                url=message.jump_url,
+                context="\n" + "\n".join(context_lines) if context_lines else "",
+            )
             
             # Create the task in ClickUp
-            logger.info(f"Creating task with title: {final_task_name}")
-            task_response = clickup_client.create_task(
+            logger.info("Creating task with title: %s", final_task_name)
+            task_response = await bot.clickup.create_task(
                 name=final_task_name,
                 description=task_description,
                 list_id=target_list_id  # Will use backlog if None
             )
+            _recent_tasks[dedup_key] = (now, task_response.get('url'))
             
-            # Create embed for the response
-            embed = discord.Embed(
-                title="✅ Task Created Successfully!",
-                description=f"I've created a new task in ClickUp with AI-generated title and smart context analysis.",
-                color=discord.Color.green(),
-                timestamp=datetime.utcnow()
-            )
-            
-            embed.add_field(
-                name="🤖 AI-Generated Title",
-                value=final_task_name,
-                inline=False
-            )
-            
+            # Build the reply embed from the static skeleton in a single construction
             if is_command:
-                embed.add_field(
-                    name="📝 Command Detected",
-                    value=f"Command: `{clean_content}`\nExtracted from context: {task_description_from_context[:100]}{'...' if len(task_description_from_context) > 100 else ''}",
-                    inline=False
-                )
+                message_field = {
+                    "name": "📝 Command Detected",
+                    "value": f"Command: `{clean_content}`\nExtracted from context: {task_description_from_context[:100]}{'...' if len(task_description_from_context) > 100 else ''}",
+                    "inline": False,
+                }
             else:
-                embed.add_field(
-                    name="📝 Original Message",
-                    value=clean_content[:100] + ("..." if len(clean_content) > 100 else ""),
-                    inline=False
-                )
+                message_field = {
+                    "name": "📝 Original Message",
+                    "value": clean_content[:100] + ("..." if len(clean_content) > 100 else ""),
+                    "inline": False,
+                }
             
             # Add context analysis info
             if relevant_context:
@@ -662,107 +1371,201 @@ async def handle_task_creation(message):
             else:
                 context_info = f"No relevant context found in {len(all_channel_messages)} recent messages"
             
-            embed.add_field(
-                name="🧠 Context Analysis",
-                value=context_info,
-                inline=False
-            )
-            
-            embed.add_field(
-                name="📍 Added to",
-                value=list_description,
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🆔 Task ID",
-                value=task_response.get('id', 'Unknown'),
-                inline=True
-            )
+            fields = [
+                {"name": "🤖 AI-Generated Title", "value": final_task_name, "inline": False},
+                message_field,
+                {"name": "🧠 Context Analysis", "value": context_info, "inline": False},
+                {"name": "📍 Added to", "value": list_description, "inline": True},
+                {"name": "🆔 Task ID", "value": task_response.get('id', 'Unknown'), "inline": True},
+            ]
             
             if 'url' in task_response:
-                embed.add_field(
-                    name="🔗 Task URL",
-                    value=f"[View in ClickUp]({task_response['url']})",
-                    inline=True
-                )
+                fields.append({"name": "🔗 Task URL", "value": f"[View in ClickUp]({task_response['url']})", "inline": True})
             
             # Add routing info in footer
-            routing_info = "📋 Backlog" if "backlog" in clean_content.lower() else "🚀 Current Sprint"
+            routing_info = "📋 Backlog" if _BACKLOG_RE.search(clean_content) else "🚀 Current Sprint"
             creation_method = "🎯 Smart Command" if is_command else "📝 Direct Description"
-            embed.set_footer(text=f"ClickUp Discord Bot • {creation_method} • Routed to: {routing_info}")
             
-            await message.reply(embed=embed)
+            embed = discord.Embed.from_dict({
+                **_SUCCESS_EMBED,
+                "timestamp": discord.utils.utcnow().isoformat(),
+                "fields": fields,
+                "footer": {"text": f"ClickUp Discord Bot • {creation_method} • Routed to: {routing_info}"},
+            })
+            
+            await _respond(message, ack, embed=embed)
             
     except Exception as e:
-        logger.error(f"Error creating task: {e}")
-        
-        error_embed = discord.Embed(
-            title="❌ Error Creating Task",
-            description=f"Sorry, I encountered an error while creating the task: {str(e)}",
-            color=discord.Color.red(),
-            timestamp=datetime.utcnow()
-        )
-        
-        await message.reply(embed=error_embed)
+        logger.error("Error creating task: %s", e)
+        # Let the user retry straight away after a failure
+        if dedup_key is not None:
+            _recent_tasks.pop(dedup_key, None)
+        
+        error_embed = discord.Embed.from_dict({
+            **_CREATE_ERROR_EMBED,
+            "description": f"Sorry, I encountered an error while creating the task: {str(e)}",
+            "timestamp": discord.utils.utcnow().isoformat(),
+        })
+        
+        await _respond(message, ack, embed=error_embed)
+
+# Accepted status spellings mapped to ClickUp statuses; read-only and built once
+_STATUS_MAP = MappingProxyType({
+    "todo": "to do",
+    "to do": "to do",
+    "backlog": "to do",
+    "start": "in progress",
+    "started": "in progress",
+    "progress": "in progress",
+    "in progress": "in progress",
+    "working": "in progress",
+    "wip": "in progress",
+    "review": "in review",
+    "in review": "in review",
+    "reviewing": "in review",
+    "done": "complete",
+    "complete": "complete",
+    "completed": "complete",
+    "finished": "complete",
+    "close": "complete",
+    "closed": "complete",
+    "resolved": "complete",
+    "fixed": "complete"
+})
+# Hyphens, underscores and repeated whitespace all read as one space ("in-progress", "in_progress")
+_STATUS_SEPARATOR_RE = re.compile(r'[\s_-]+')
 
 def normalize_status(status_input: str) -> Optional[str]:
     """Normalize status input to valid ClickUp status"""
-    status_mapping = {
-        "todo": "to do",
-        "to do": "to do", 
-        "backlog": "to do",
-        "start": "in progress",
-        "started": "in progress",
-        "progress": "in progress",
-        "in progress": "in progress",
-        "working": "in progress",
-        "review": "in review",
-        "in review": "in review",
-        "reviewing": "in review",
-        "done": "complete",
-        "complete": "complete",
-        "completed": "complete",
-        "finished": "complete",
-        "close": "complete",
-        "closed": "complete",
-        "resolved": "complete",
-        "fixed": "complete"
-    }
+    normalized = _STATUS_SEPARATOR_RE.sub(' ', status_input.strip().lower())
+    return _STATUS_MAP.get(normalized)
+
+# Minimum cosine similarity between the query and a task for the task to count as a match;
+# when the runners-up score within the margin of the best, GPT breaks the tie
+_TASK_MATCH_THRESHOLD = 0.78
+_TASK_MATCH_TIE_MARGIN = 0.02
+
+def _task_key(task: dict) -> str:
+    """Embedding cache key; changes whenever the task's id, name or description does"""
+    return hashlib.sha256(f"{task.get('id')}|{task.get('name')}|{task.get('description') or ''}".encode()).hexdigest()
+
+# Drops markdown emphasis and flattens newlines in one pass
+_DESCRIPTION_CLEANUP = str.maketrans({'*': None, '\n': ' '})
+
+def _task_text(task: dict) -> str:
+    """Task name plus a flattened description excerpt, as compared against queries"""
+    task_name = task.get('name', 'Unnamed Task')
+    # Clean description from markdown/formatting
+    clean_desc = (task.get('description') or '').translate(_DESCRIPTION_CLEANUP)[:200]
+    if clean_desc.strip():
+        return f"{task_name} - {clean_desc}"
+    return task_name
+
+# Serializes cache reads and writes so the background warm-up and /update never
+# embed the same tasks twice
+_embedding_lock = asyncio.Lock()
+
+async def _load_vectors(keys: List[str], texts: List[str], query: Optional[str] = None) -> Optional[tuple[Optional[np.ndarray], np.ndarray]]:
+    """Return (query vector, matrix of texts), embedding only keys missing from the cache; None on failure"""
+    async with _embedding_lock:
+        # Only new or changed entries need embedding; the rest come from the persistent cache
+        cache = bot.embedding_cache
+        cached_vectors = await asyncio.to_thread(cache.get_many, keys) if cache is not None else {}
+        missing = [i for i, key in enumerate(keys) if key not in cached_vectors]
+        
+        # One embeddings request covers the query and every uncached text
+        request = ([query] if query is not None else []) + [texts[i] for i in missing]
+        query_vector = None
+        if request:
+            vectors = await _embed_texts(request)
+            if vectors is None:
+                return None
+            if query is not None:
+                query_vector, vectors = vectors[0], vectors[1:]
+            new_vectors = {keys[i]: vector for i, vector in zip(missing, vectors)}
+            if cache is not None:
+                await asyncio.to_thread(cache.put_many, new_vectors)
+            cached_vectors.update(new_vectors)
     
-    normalized = status_input.lower().strip()
-    return status_mapping.get(normalized)
+    return query_vector, np.stack([cached_vectors[key] for key in keys])
+
+# How often the background task re-embeds the newest sprint's tasks
+_EMBEDDING_REFRESH_INTERVAL = 300
 
-async def find_similar_task(task_description: str, tasks: List[dict]) -> Optional[dict]:
-    """Use AI to find the most similar task based on semantic similarity"""
-    if not tasks or not openai.api_key:
+async def warm_embedding_cache():
+    """Keep embeddings for the newest sprint ready so /update only has to embed its query"""
+    while True:
+        try:
+            tasks = await bot.clickup.get_tasks_from_newest_sprint()
+            if tasks:
+                await _load_vectors([_task_key(task) for task in tasks], [_task_text(task) for task in tasks])
+                logger.debug("Embedding cache warm for %d sprint tasks", len(tasks))
+        except Exception as e:
+            logger.warning("Failed to warm the embedding cache: %s", e)
+        await asyncio.sleep(_EMBEDDING_REFRESH_INTERVAL)
+
+def _exact_task_match(task_description: str, tasks: List[dict]) -> Optional[dict]:
+    """Task whose name equals the query, or the only one containing it, ignoring case"""
+    query = task_description.casefold().strip()
+    if not query:
+        return None
+    
+    containing = []
+    for task in tasks:
+        name = (task.get('name') or '').casefold().strip()
+        if name == query:
+            return task
+        if query in name:
+            containing.append(task)
+    return containing[0] if len(containing) == 1 else None
+
+async def find_similar_task(task_description: str, tasks: List[dict], query_vector: Optional[np.ndarray] = None) -> Optional[dict]:
+    """Find the most similar task by embedding similarity, with AI only for near-ties
+    
+    Pass query_vector when the description was already embedded alongside other work.
+    """
+    if not tasks:
+        return None
+    
+    # Wording that names a task outright needs no embeddings at all
+    exact_task = _exact_task_match(task_description, tasks)
+    if exact_task is not None:
+        logger.info("Exact name match: %s", exact_task.get('name'))
+        return exact_task
+    
+    if openai_client is None:
+        return None
+    
+    task_texts = [_task_text(task) for task in tasks]
+    query = task_description if query_vector is None else None
+    loaded = await _load_vectors([_task_key(task) for task in tasks], task_texts, query=query)
+    if loaded is None:
+        return await _rank_tasks_with_gpt(task_description, tasks, task_texts)
+    if query_vector is None:
+        query_vector = loaded[0]
+    task_matrix = loaded[1]
+    
+    # Scoring is a single matrix-vector product
+    scores = task_matrix @ query_vector
+    best = int(scores.argmax())
+    if scores[best] < _TASK_MATCH_THRESHOLD:
+        logger.info("No task similar enough to '%s' (best score %.2f)", task_description, scores[best])
         return None
     
+    contenders = np.flatnonzero(scores >= scores[best] - _TASK_MATCH_TIE_MARGIN)
+    if len(contenders) > 1:
+        logger.info("%d tasks within %.2f of the best score, asking AI to break the tie", len(contenders), _TASK_MATCH_TIE_MARGIN)
+        return await _rank_tasks_with_gpt(task_description, [tasks[i] for i in contenders], [task_texts[i] for i in contenders])
+    
+    selected_task = tasks[best]
+    logger.info("Embedding match: %s (score %.2f)", selected_task.get('name'), scores[best])
+    return selected_task
+
+async def _rank_tasks_with_gpt(task_description: str, tasks: List[dict], task_texts: List[str]) -> Optional[dict]:
+    """Use AI to pick the most similar task when embeddings are unavailable"""
     try:
-        # Prepare task list for AI analysis
-        task_list = []
-        for i, task in enumerate(tasks):
-            task_name = task.get('name', 'Unnamed Task')
-            task_desc = task.get('description', '')
-            # Clean description from markdown/formatting
-            clean_desc = task_desc.replace('**', '').replace('*', '').replace('\n', ' ')[:200]
-            
-            task_info = f"{i+1}. {task_name}"
-            if clean_desc.strip():
-                task_info += f" - {clean_desc}"
-            task_list.append(task_info)
+        tasks_text = "\n".join(f"{i+1}. {text}" for i, text in enumerate(task_texts))
         
-        tasks_text = "\n".join(task_list)
-        
-        system_prompt = """You are a task matching assistant. Given a task description and a list of existing tasks, find the most semantically similar task.
-
-Rules:
-- Look for semantic similarity, not just exact word matches
-- Consider synonyms, related concepts, and context
-- Focus on the main purpose/goal of the task
-- If no task is reasonably similar, return "none"
-- Return only the number of the most similar task (e.g., "3")"""
-
         user_prompt = f"""Find the most similar task to: "{task_description}"
 
 Available tasks:
@@ -770,13 +1573,13 @@ Available tasks:
 
 Which task number is most similar? Return only the number or "none":"""
 
-        response = openai.chat.completions.create(
-            model="gpt-4o",
+        response = await openai_client.chat.completions.create(
+            model=_FAST_MODEL,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _TASK_MATCH_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            max_tokens=20,
+            max_tokens=4,
             temperature=0.3
         )
         
@@ -790,77 +1593,90 @@ Which task number is most similar? Return only the number or "none":"""
             task_index = int(result) - 1
             if 0 <= task_index < len(tasks):
                 selected_task = tasks[task_index]
-                logger.info(f"AI selected task: {selected_task.get('name')} (confidence: semantic match)")
+                logger.info("AI selected task: %s (confidence: semantic match)", selected_task.get('name'))
                 return selected_task
             else:
-                logger.warning(f"AI returned invalid task index: {result}")
+                logger.warning("AI returned invalid task index: %s", result)
                 return None
                 
         except ValueError:
-            logger.warning(f"Could not parse AI response: {result}")
+            logger.warning("Could not parse AI response: %s", result)
             return None
         
     except Exception as e:
-        logger.error(f"Error finding similar task: {e}")
+        logger.error("Error finding similar task: %s", e)
         return None
 
+# Member names are short, so their embeddings sit closer together than task texts
+_MEMBER_MATCH_THRESHOLD = 0.7
+
+# Dots, underscores and hyphens in usernames read as spaces ("jan.kowalski")
+_NAME_SEPARATORS = str.maketrans('._-', '   ')
+
+def _member_key(member: dict) -> str:
+    """Embedding cache key; changes whenever the member's id, username or email does"""
+    user = member.get('user', {})
+    return hashlib.sha256(f"member|{user.get('id')}|{user.get('username')}|{user.get('email') or ''}".encode()).hexdigest()
+
+def _member_text(member: dict) -> str:
+    """Username and email name with separators spelled out as spaces, as compared against queries"""
+    user = member.get('user', {})
+    names = [user.get('username') or '', (user.get('email') or '').split('@')[0]]
+    return " / ".join(name.translate(_NAME_SEPARATORS) for name in names if name)
+
+async def _match_member_by_embedding(name_query: str, clickup_members: List[dict]) -> Optional[dict]:
+    """Pick the member whose cached name embedding is closest to the query; None below the threshold"""
+    loaded = await _load_vectors(
+        [_member_key(member) for member in clickup_members],
+        [_member_text(member) for member in clickup_members],
+        query=name_query
+    )
+    if loaded is None:
+        return None
+    query_vector, member_matrix = loaded
+    
+    scores = member_matrix @ query_vector
+    best = int(scores.argmax())
+    if scores[best] < _MEMBER_MATCH_THRESHOLD:
+        logger.info("No member name close enough to '%s' (best score %.2f)", name_query, scores[best])
+        return None
+    
+    matched_member = clickup_members[best]
+    logger.info("Embedding matched '%s' → '%s' (score %.2f)", name_query, matched_member.get('user', {}).get('username', 'Unknown'), scores[best])
+    return matched_member
+
+# Minimum rapidfuzz WRatio (0-100) for the offline member fallback
+_MEMBER_FUZZY_CUTOFF = 70
+
+def _fuzzy_match_member(name_query: str, clickup_members: List[dict]) -> Optional[dict]:
+    """Best fuzzy match over usernames and email names; None below the cutoff"""
+    choices = {i: _member_text(member) for i, member in enumerate(clickup_members)}
+    best = process.extractOne(
+        name_query, choices,
+        scorer=fuzz.WRatio, processor=utils.default_process, score_cutoff=_MEMBER_FUZZY_CUTOFF
+    )
+    if best is None:
+        logger.info("No fallback match found for '%s'", name_query)
+        return None
+    
+    choice, score, index = best
+    logger.info("Fuzzy match: '%s' → '%s' (score %.0f)", name_query, choice, score)
+    return clickup_members[index]
+
 async def match_member_by_name(name_query: str, clickup_members: List[dict]) -> Optional[dict]:
     """Use AI to match an approximate name to a ClickUp team member with advanced semantic matching"""
     if not clickup_members:
         return None
-
-    name_query_lower = name_query.lower().strip()
     
-    # Fallback to enhanced substring search when OpenAI is unavailable
-    if not openai.api_key:
-        logger.info(f"Using fallback matching for '{name_query}'")
-        
-        # Try different matching strategies
-        for member in clickup_members:
-            user = member.get('user', {})
-            username = user.get('username', '').lower()
-            email = user.get('email', '').lower()
-            
-            # Strategy 1: Exact substring match
-            if (name_query_lower in username or 
-                name_query_lower in email):
-                logger.info(f"Exact substring match: '{name_query}' → '{username}'")
-                return member
-            
-            # Strategy 2: Split username by dots/underscores and check fragments
-            username_parts = username.replace('.', ' ').replace('_', ' ').replace('-', ' ').split()
-            for part in username_parts:
-                if name_query_lower in part or part in name_query_lower:
-                    logger.info(f"Fragment match: '{name_query}' → '{username}' (matched part: '{part}')")
-                    return member
-            
-            # Strategy 3: Split email by @ and check username part
-            email_username = email.split('@')[0] if '@' in email else email
-            email_parts = email_username.replace('.', ' ').replace('_', ' ').replace('-', ' ').split()
-            for part in email_parts:
-                if name_query_lower in part or part in name_query_lower:
-                    logger.info(f"Email fragment match: '{name_query}' → '{email}' (matched part: '{part}')")
-                    return member
-        
-        # Strategy 4: Fuzzy matching - check if query starts with any part or vice versa
-        for member in clickup_members:
-            user = member.get('user', {})
-            username = user.get('username', '').lower()
-            email = user.get('email', '').lower()
-            
-            # Check if query is a prefix of any part
-            all_parts = []
-            all_parts.extend(username.replace('.', ' ').replace('_', ' ').replace('-', ' ').split())
-            if '@' in email:
-                all_parts.extend(email.split('@')[0].replace('.', ' ').replace('_', ' ').replace('-', ' ').split())
-            
-            for part in all_parts:
-                if part.startswith(name_query_lower) or name_query_lower.startswith(part):
-                    logger.info(f"Prefix/suffix match: '{name_query}' → '{username}' (matched part: '{part}')")
-                    return member
-        
-        logger.info(f"No fallback match found for '{name_query}'")
-        return None
+    # Fallback to fuzzy string matching when OpenAI is unavailable
+    if openai_client is None:
+        logger.info("Using fallback matching for '%s'", name_query)
+        return _fuzzy_match_member(name_query, clickup_members)
+
+    # Embedding match against cached member names settles most queries without a completion
+    matched_member = await _match_member_by_embedding(name_query, clickup_members)
+    if matched_member is not None:
+        return matched_member
 
     # AI-powered semantic matching
     try:
@@ -893,25 +1709,6 @@ async def match_member_by_name(name_query: str, clickup_members: List[dict]) ->
         
         name_list_text = "\n".join(name_list)
         
-        system_prompt = """You are an expert at matching names and usernames. Given a partial name or nickname, find the best matching ClickUp team member.
-
-Matching rules:
-- Look for exact matches first
-- Then check for partial matches (e.g., "kowal" matches "jan.kowalski")
-- Consider common name variations (dots, underscores, dashes)
-- Match fragments of usernames or emails
-- Consider both first name and last name parts
-- Be flexible with partial queries (e.g., "john" can match "john.doe" or "johnsmith")
-- If multiple matches are possible, prefer the most specific/exact match
-
-Examples:
-- "kowal" → "jan.kowalski" (partial last name)
-- "john" → "john.doe" (first name)
-- "smith" → "johnsmith" or "john.smith" (last name part)
-- "jdoe" → "john.doe" (username pattern)
-
-Return only the number of the best match or 'none' if no reasonable match exists."""
-
         user_prompt = f"""Find the best match for the query: "{name_query}"
 
 Available ClickUp team members:
@@ -919,20 +1716,20 @@ Available ClickUp team members:
 
 Which member number matches best? Return only the number (e.g., "3") or "none":"""
 
-        response = openai.chat.completions.create(
-            model="gpt-4o",
+        response = await openai_client.chat.completions.create(
+            model=_FAST_MODEL,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _MEMBER_MATCH_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            max_tokens=20,
+            max_tokens=4,
             temperature=0.1,
         )
         
         result = response.choices[0].message.content.strip().lower()
         
         if result == "none":
-            logger.info(f"AI found no match for '{name_query}'")
+            logger.info("AI found no match for '%s'", name_query)
             return None
 
         try:
@@ -940,37 +1737,35 @@ Which member number matches best? Return only the number (e.g., "3") or "none":"
             if 0 <= index < len(clickup_members):
                 matched_member = clickup_members[index]
                 matched_username = matched_member.get('user', {}).get('username', 'Unknown')
-                logger.info(f"AI matched '{name_query}' → '{matched_username}'")
+                logger.info("AI matched '%s' → '%s'", name_query, matched_username)
                 return matched_member
             else:
-                logger.warning(f"AI returned invalid index: {result}")
+                logger.warning("AI returned invalid index: %s", result)
                 return None
                 
         except ValueError:
-            logger.warning(f"Could not parse AI response: {result}")
+            logger.warning("Could not parse AI response: %s", result)
             return None
         
     except Exception as e:
-        logger.error(f"Error in AI semantic matching: {e}")
-        # Fall back to simple search if AI fails
-        for member in clickup_members:
-            user = member.get('user', {})
-            username = user.get('username', '').lower()
-            email = user.get('email', '').lower()
-            
-            if (name_query_lower in username or name_query_lower in email):
-                logger.info(f"Emergency fallback match: '{name_query}' → '{username}'")
-                return member
-        
-        return None
+        logger.error("Error in AI semantic matching: %s", e)
+        # Fall back to fuzzy search if AI fails
+        return _fuzzy_match_member(name_query, clickup_members)
+
+# Status keyword ending an !update command; longer phrases come first so
+# "in progress" wins over "progress"
+_TRAILING_STATUS_RE = re.compile(
+    r'(?:^|\s)(in progress|in review|to do|todo|review|progress|done|complete|closed|resolved|fixed)\s*$',
+    re.IGNORECASE
+)
 
 def parse_update_command(command_text: str) -> tuple[Optional[str], Optional[str]]:
-    """Parse !update command to extract task description and status
+    """Split an update command into task description and trailing status
     
     Examples:
-    - "!update integracja bota z clickupem review" -> ("integracja bota z clickupem", "review")
+    - "!update integracja bota z clickupem review" -> ("integracja bota z clickupem", "in review")
     - "!update fix login bug in progress" -> ("fix login bug", "in progress")
-    - "!update dokumentacja closed" -> ("dokumentacja", "closed")
+    - "!update dokumentacja closed" -> ("dokumentacja", "complete")
     
     Returns:
         tuple: (task_description, status) or (None, None) if parsing fails
@@ -981,35 +1776,32 @@ def parse_update_command(command_text: str) -> tuple[Optional[str], Optional[str
     if not content:
         return None, None
     
-    # Valid status keywords (order matters - longer phrases first)
-    valid_statuses = ["in progress", "in review", "to do", "todo", "review", "progress", "done", "complete", "closed", "resolved", "fixed"]
-    
     # Find status at the end of the command
-    found_status = None
-    task_description = content
-    
-    for status in valid_statuses:
-        if content.lower().endswith(status.lower()):
-            found_status = status.lower()
-            # Remove status from task description
-            task_description = content[:-len(status)].strip()
-            break
-    
-    if not found_status:
+    match = _TRAILING_STATUS_RE.search(content)
+    if not match:
         return None, None
     
+    found_status = match.group(1).lower()
+    task_description = content[:match.start()].strip()
+    
     # Normalize the status
     normalized_status = normalize_status(found_status)
     
     return task_description, normalized_status
 
+_UPDATE_FOOTER = "ClickUp Discord Bot • AI Task Matching"
+
 @bot.tree.command(name="update", description="Update task status using AI semantic matching")
-@app_commands.describe(task_description="Task description to match", status="New task status")
-async def update_command(interaction: discord.Interaction, task_description: str, status: str):
+@app_commands.describe(task_description="Task description to match, optionally ending with the status", status="New task status", assignee="Team member to assign, by approximate name")
+async def update_command(interaction: discord.Interaction, task_description: str, status: Optional[str] = None, assignee: Optional[str] = None):
     """Update task status using AI semantic matching"""
     await interaction.response.defer()
 
-    new_status = normalize_status(status)
+    if status is None:
+        # "/update fix login bug in progress" carries the status at the end of the description
+        task_description, new_status = parse_update_command(task_description)
+    else:
+        new_status = normalize_status(status)
     if not new_status:
         embed = discord.Embed(
             title="❌ Invalid Status",
@@ -1025,100 +1817,122 @@ async def update_command(interaction: discord.Interaction, task_description: str
         return
 
     try:
-        # Send typing indicator
-        async with interaction.channel.typing():
-            # Get tasks from newest sprint
-            logger.info(f"Looking for tasks similar to: '{task_description}' with status: '{new_status}'")
-            tasks = clickup_client.get_tasks_from_newest_sprint()
-            
-            if not tasks:
-                embed = discord.Embed(
-                    title="❌ No Tasks Found",
-                    description="No tasks found in the newest sprint list.",
-                    color=discord.Color.red()
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            logger.info(f"Found {len(tasks)} tasks in newest sprint")
-            
-            # Find similar task using AI
-            similar_task = await find_similar_task(task_description, tasks)
-            
-            if not similar_task:
-                embed = discord.Embed(
-                    title="❌ No Similar Task Found",
-                    description=f"Could not find a task similar to: '{task_description}'",
-                    color=discord.Color.red()
-                )
-                embed.add_field(
-                    name="Available Tasks",
-                    value=f"Found {len(tasks)} tasks in newest sprint.",
-                    inline=False
-                )
-                await interaction.followup.send(embed=embed)
-                return
-            
-            # Update task status
-            task_id = similar_task.get('id')
-            task_name = similar_task.get('name')
-            current_status = similar_task.get('status', {}).get('status', 'Unknown')
-            
-            logger.info(f"Updating task '{task_name}' (ID: {task_id}) from '{current_status}' to '{new_status}'")
-            
-            update_response = clickup_client.update_task_status(task_id, new_status)
-            
-            # Create success embed
+        # Get tasks from newest sprint
+        logger.info("Looking for tasks similar to: '%s' with status: '%s'", task_description, new_status)
+        # The query embedding doesn't depend on the tasks, so both requests run at once
+        if openai_client is not None:
+            tasks, query_vector = await asyncio.gather(
+                bot.clickup.get_tasks_from_newest_sprint(),
+                _embed_text(task_description)
+            )
+        else:
+            tasks, query_vector = await bot.clickup.get_tasks_from_newest_sprint(), None
+        
+        if not tasks:
             embed = discord.Embed(
-                title="✅ Task Updated Successfully!",
-                description=f"Found and updated the most similar task using AI semantic matching.",
-                color=discord.Color.green(),
-                timestamp=datetime.utcnow()
+                title="❌ No Tasks Found",
+                description="No tasks found in the newest sprint list.",
+                color=discord.Color.red()
             )
-            
-            embed.add_field(
-                name="🔍 Search Query",
-                value=task_description,
-                inline=False
+            await interaction.followup.send(embed=embed)
+            return
+        
+        logger.info("Found %d tasks in newest sprint", len(tasks))
+        
+        # Find similar task using AI
+        similar_task = await find_similar_task(task_description, tasks, query_vector)
+        
+        if not similar_task:
+            embed = discord.Embed(
+                title="❌ No Similar Task Found",
+                description=f"Could not find a task similar to: '{task_description}'",
+                color=discord.Color.red()
             )
-            
             embed.add_field(
-                name="🎯 Matched Task",
-                value=task_name,
+                name="Available Tasks",
+                value=f"Found {len(tasks)} tasks in newest sprint.",
                 inline=False
             )
-            
+            await interaction.followup.send(embed=embed)
+            return
+        
+        # Update task status
+        task_id = similar_task.get('id')
+        task_name = similar_task.get('name')
+        current_status = similar_task.get('status', {}).get('status', 'Unknown')
+        
+        logger.info("Updating task '%s' (ID: %s) from '%s' to '%s'", task_name, task_id, current_status, new_status)
+        
+        update_response = await bot.clickup.update_task_status(task_id, new_status)
+        
+        assignee_text = None
+        if assignee:
+            member = await match_member_by_name(assignee, await bot.clickup.get_team_members())
+            if member is None:
+                assignee_text = f"No team member matched '{assignee}'"
+            else:
+                user = member.get('user', {})
+                logger.info("Assigning task '%s' to %s", task_name, user.get('username'))
+                await bot.clickup.assign_task(task_id, user.get('id'))
+                assignee_text = user.get('username') or user.get('email')
+        
+        # Create success embed
+        embed = discord.Embed(
+            title="✅ Task Updated Successfully!",
+            description="Found and updated the most similar task using AI semantic matching.",
+            color=discord.Color.green(),
+            timestamp=discord.utils.utcnow()
+        )
+        
+        embed.add_field(
+            name="🔍 Search Query",
+            value=task_description,
+            inline=False
+        )
+        
+        embed.add_field(
+            name="🎯 Matched Task",
+            value=task_name,
+            inline=False
+        )
+        
+        embed.add_field(
+            name="📊 Status Change",
+            value=f"`{current_status}` → `{new_status}`",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="🆔 Task ID",
+            value=task_id,
+            inline=True
+        )
+        
+        if assignee_text:
             embed.add_field(
-                name="📊 Status Change",
-                value=f"`{current_status}` → `{new_status}`",
+                name="👤 Assignee",
+                value=assignee_text,
                 inline=True
             )
-            
+        
+        if 'url' in similar_task:
             embed.add_field(
-                name="🆔 Task ID",
-                value=task_id,
+                name="🔗 Task URL",
+                value=f"[View in ClickUp]({similar_task['url']})",
                 inline=True
             )
-            
-            if 'url' in similar_task:
-                embed.add_field(
-                    name="🔗 Task URL",
-                    value=f"[View in ClickUp]({similar_task['url']})",
-                    inline=True
-                )
-            
-            embed.set_footer(text="ClickUp Discord Bot • AI Task Matching")
-            await interaction.followup.send(embed=embed)
+        
+        embed.set_footer(text=_UPDATE_FOOTER)
+        await interaction.followup.send(embed=embed)
 
     except Exception as e:
-        logger.error(f"Error updating task: {e}")
+        logger.error("Error updating task: %s", e)
 
-        error_embed = discord.Embed(
-            title="❌ Error Updating Task",
-            description=f"Sorry, I encountered an error: {str(e)}",
-            color=discord.Color.red(),
-            timestamp=datetime.utcnow()
-        )
+        error_embed = discord.Embed.from_dict({
+            **_UPDATE_ERROR_EMBED,
+            "description": f"Sorry, I encountered an error: {str(e)}",
+            "timestamp": discord.utils.utcnow().isoformat(),
+        })
 
         await interaction.followup.send(embed=error_embed)
 
@@ -1127,15 +1941,13 @@ async def tasks_command(interaction: discord.Interaction):
     """Show all tasks from newest sprint list"""
     try:
         await interaction.response.defer()
-        tasks = clickup_client.get_tasks_from_newest_sprint()
+        newest_list, tasks = await bot.clickup.get_newest_sprint_with_list()
         
         if not tasks:
             await interaction.followup.send("❌ No tasks found in newest sprint list")
             return
         
-        # Get newest list info
-        newest_list = clickup_client.get_newest_list_from_folder()
-        list_name = newest_list.get('name', 'Unknown') if newest_list else 'Unknown'
+        list_name = newest_list.get('name', 'Unknown')
         
         embed = discord.Embed(
             title=f"📋 Tasks in {list_name}",
@@ -1167,12 +1979,12 @@ async def tasks_command(interaction: discord.Interaction):
         await interaction.followup.send(embed=embed)
         
     except Exception as e:
-        logger.error(f"Error getting tasks: {e}")
+        logger.error("Error getting tasks: %s", e)
         await interaction.followup.send(f"❌ Error getting tasks: {e}")
 
-@bot.tree.command(name="help", description="Show help information")
-async def help_command(interaction: discord.Interaction):
-    """Show help information"""
+@functools.cache
+def build_help_embed() -> discord.Embed:
+    """Build the help embed once; its content doesn't change after startup"""
     embed = discord.Embed(
         title="🤖 ClickUp Discord Bot Help",
         description="I help you create and manage ClickUp tasks directly from Discord using AI!",
@@ -1211,7 +2023,7 @@ async def help_command(interaction: discord.Interaction):
     
     embed.add_field(
         name="⚡ Commands",
-        value="`/help` - Show this help message\n`/update` - Update task status with AI matching\n`/tasks` - Show tasks in newest sprint\n`/assign` - Assign ClickUp user to task\n`/match` - Test member name matching\n`/members` - Show ClickUp team members\n`/status` - Check bot status\n`/health` - Simple health check\n`/lists` - Show available lists",
+        value="`/help` - Show this help message\n`/update` - Update task status (and optionally assignee) with AI matching\n`/tasks` - Show tasks in newest sprint\n`/assign` - Assign ClickUp user to task\n`/match` - Test member name matching\n`/members` - Show ClickUp team members\n`/status` - Check bot status\n`/health` - Simple health check\n`/lists` - Show available lists",
         inline=False
     )
     
@@ -1228,11 +2040,16 @@ async def help_command(interaction: discord.Interaction):
     )
     
     embed.set_footer(text="ClickUp Discord Bot • Powered by OpenAI")
-    await interaction.response.send_message(embed=embed)
+    return embed
 
-@bot.tree.command(name="status", description="Check bot status")
-async def status_command(interaction: discord.Interaction):
-    """Check bot status"""
+@bot.tree.command(name="help", description="Show help information")
+async def help_command(interaction: discord.Interaction):
+    """Show help information"""
+    await interaction.response.send_message(embed=build_help_embed())
+
+@functools.cache
+def build_status_embed() -> dict:
+    """Build the status embed skeleton as a dict; live fields are filled in per request"""
     embed = discord.Embed(
         title="📊 Bot Status",
         color=discord.Color.green()
@@ -1244,20 +2061,12 @@ async def status_command(interaction: discord.Interaction):
         inline=True
     )
     
-    embed.add_field(
-        name="Guilds",
-        value=str(len(bot.guilds)),
-        inline=True
-    )
-    
-    embed.add_field(
-        name="Ping",
-        value=f"{round(bot.latency * 1000)}ms",
-        inline=True
-    )
+    # Placeholders for live values, see status_command
+    embed.add_field(name="Guilds", value="-", inline=True)
+    embed.add_field(name="Ping", value="-", inline=True)
     
     # Check OpenAI availability
-    openai_status = "🟢 Connected" if os.getenv('OPENAI_API_KEY') else "🔴 Not configured"
+    openai_status = "🟢 Connected" if OPENAI_API_KEY else "🔴 Not configured"
     embed.add_field(
         name="OpenAI",
         value=openai_status,
@@ -1265,21 +2074,29 @@ async def status_command(interaction: discord.Interaction):
     )
     
     # Check ClickUp availability
-    clickup_status = "🟢 Connected" if os.getenv('CLICKUP_API_TOKEN') else "🔴 Not configured"
+    clickup_status = "🟢 Connected" if CLICKUP_API_TOKEN else "🔴 Not configured"
     embed.add_field(
         name="ClickUp",
         value=clickup_status,
         inline=True
     )
     
+    embed.add_field(name="Sprint Folder", value="-", inline=True)
+    return embed.to_dict()
+
+@bot.tree.command(name="status", description="Check bot status")
+async def status_command(interaction: discord.Interaction):
+    """Check bot status"""
+    # Embed.copy() shares the field list, so give each response its own fields
+    status_template = build_status_embed()
+    embed = discord.Embed.from_dict({**status_template, "fields": [dict(field) for field in status_template["fields"]]})
+    embed.set_field_at(1, name="Guilds", value=str(len(bot.guilds)), inline=True)
+    embed.set_field_at(2, name="Ping", value=f"{round(bot.latency * 1000)}ms", inline=True)
+    
     # Check Sprint folder
-    lists = clickup_client.get_folder_lists()
+    lists = await bot.clickup.get_folder_lists()
     folder_status = f"🟢 {len(lists)} lists" if lists else "🔴 No access"
-    embed.add_field(
-        name="Sprint Folder",
-        value=folder_status,
-        inline=True
-    )
+    embed.set_field_at(5, name="Sprint Folder", value=folder_status, inline=True)
     
     await interaction.response.send_message(embed=embed)
 
@@ -1288,7 +2105,9 @@ async def lists_command(interaction: discord.Interaction):
     """Show available lists in sprint folder"""
     try:
         await interaction.response.defer()
-        lists = clickup_client.get_folder_lists()
+        # Listing is how admins check a newly added sprint, so always read it fresh
+        bot.clickup.invalidate_lists_cache()
+        lists = await bot.clickup.get_folder_lists()
         
         if not lists:
             await interaction.followup.send("❌ No lists found in sprint folder")
@@ -1323,7 +2142,7 @@ async def lists_command(interaction: discord.Interaction):
             )
         
         # If we have more than 10 lists and the newest isn't shown
-        if len(lists) > 10 and newest_list_id not in [lst.get('id') for lst in display_lists]:
+        if len(lists) > 10 and not any(lst.get('id') == newest_list_id for lst in display_lists):
             embed.add_field(
                 name="⚠️ Note",
                 value=f"Showing first 10 of {len(lists)} lists. Newest list ({lists[-1].get('name')}) is not shown but will be used for new tasks.",
@@ -1334,7 +2153,7 @@ async def lists_command(interaction: discord.Interaction):
         await interaction.followup.send(embed=embed)
         
     except Exception as e:
-        logger.error(f"Error getting lists: {e}")
+        logger.error("Error getting lists: %s", e)
         await interaction.followup.send(f"❌ Error getting lists: {e}")
 
 @bot.tree.command(name="health", description="Simple health check")
@@ -1342,30 +2161,74 @@ async def health_command(interaction: discord.Interaction):
     """Simple health check command"""
     await interaction.response.send_message('🏓 ping')
 
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Move the root log handlers onto a background thread so log I/O never blocks the event loop"""
+    root = logging.getLogger()
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
 def main():
     """Main function to run the bot"""
+    _start_log_listener()
+    
     # Check required environment variables
-    required_vars = ['DISCORD_BOT_TOKEN', 'CLICKUP_API_TOKEN', 'CLICKUP_LIST_ID']
-    recommended_vars = ['OPENAI_API_KEY', 'CLICKUP_FOLDER_ID', 'CLICKUP_TEAM_ID']
+    required_vars = {
+        'DISCORD_BOT_TOKEN': DISCORD_BOT_TOKEN,
+        'CLICKUP_API_TOKEN': CLICKUP_API_TOKEN,
+        'CLICKUP_LIST_ID': CLICKUP_LIST_ID,
+    }
+    recommended_vars = {
+        'OPENAI_API_KEY': OPENAI_API_KEY,
+        'CLICKUP_FOLDER_ID': CLICKUP_FOLDER_ID,
+        'CLICKUP_TEAM_ID': CLICKUP_TEAM_ID,
+    }
     
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-    missing_recommended = [var for var in recommended_vars if not os.getenv(var)]
+    missing_vars = [var for var, value in required_vars.items() if not value]
+    missing_recommended = [var for var, value in recommended_vars.items() if not value]
     
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        logger.error("Missing required environment variables: %s", ', '.join(missing_vars))
         logger.error("Please create a .env file based on env.example")
         return
     
     if missing_recommended:
-        logger.warning(f"Missing recommended environment variables: {', '.join(missing_recommended)}")
+        logger.warning("Missing recommended environment variables: %s", ', '.join(missing_recommended))
         logger.warning("Bot will work with limited features")
     
+    # data/ is the volume docker-compose mounts, so the cache outlives the container
+    cache_dir = os.path.dirname(EMBEDDING_CACHE_PATH)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    bot.embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH)
+    
+    # Initialize ClickUp client
+    bot.clickup = ClickUpClient(
+        api_token=CLICKUP_API_TOKEN,
+        list_id=CLICKUP_LIST_ID,  # Backlog list
+        team_id=CLICKUP_TEAM_ID,
+        folder_id=CLICKUP_FOLDER_ID,  # Sprint folder
+        http=http_client
+    )
+    
+    # Run on the libuv-based event loop when uvloop is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+    
     try:
-        bot.run(os.getenv('DISCORD_BOT_TOKEN'))
+        # Logging is configured at import; stop discord.py resetting its logger to INFO
+        bot.run(DISCORD_BOT_TOKEN, log_handler=None)
     except discord.LoginFailure:
         logger.error("Failed to login. Please check your Discord bot token.")
     except Exception as e:
-        logger.error(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,17 @@
+from typing import NamedTuple, Optional
+
+import pytest
+
+from bot import CLICKUP_API_TOKEN, CLICKUP_LIST_ID, CLICKUP_TEAM_ID
+
+
+class ClickUpCredentials(NamedTuple):
+    api_token: Optional[str]
+    list_id: Optional[str]
+    team_id: Optional[str]
+
+
+@pytest.fixture(scope="session")
+def clickup_credentials() -> ClickUpCredentials:
+    """ClickUp settings as read by bot.py, which loads .env once at import"""
+    return ClickUpCredentials(CLICKUP_API_TOKEN, CLICKUP_LIST_ID, CLICKUP_TEAM_ID)
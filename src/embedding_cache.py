@@ -0,0 +1,77 @@
+"""
+Persistent cache of text embeddings, keyed by a hash of the embedded content.
+Lets the bot embed only tasks that are new or changed since the last lookup.
+The methods block on disk I/O; async callers run them with asyncio.to_thread.
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+
+import numpy as np
+
+class EmbeddingCache:
+    """SQLite-backed map from a content key to its float32 embedding vector"""
+
+    # SQLite caps the number of host parameters in a single statement
+    _MAX_QUERY_KEYS = 500
+
+    def __init__(self, path: str = "embeddings.sqlite3", max_memory: int = 4096):
+        self.path = path
+        self.max_memory = max_memory
+        # Calls arrive from worker threads; the lock keeps them off the connection one at a time
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("CREATE TABLE IF NOT EXISTS emb (key TEXT PRIMARY KEY, vec BLOB NOT NULL)")
+        self._conn.commit()
+        # Most recently used vectors, so repeated lookups skip SQLite
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """Keep a vector in memory, evicting the least recently used one when full"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Return the cached vectors for whichever of the keys are present"""
+        with self._lock:
+            found = {}
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+            missing = [key for key in keys if key not in found]
+
+            for start in range(0, len(missing), self._MAX_QUERY_KEYS):
+                batch = missing[start:start + self._MAX_QUERY_KEYS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(f"SELECT key, vec FROM emb WHERE key IN ({placeholders})", batch)
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32)
+                    self._remember(key, vector)
+                    found[key] = vector
+
+        return found
+
+    def put_many(self, vectors: Dict[str, np.ndarray]):
+        """Store vectors, replacing any existing entries with the same key"""
+        if not vectors:
+            return
+        rows = [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in vectors.items()]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO emb (key, vec) VALUES (?, ?)", rows)
+            self._conn.commit()
+            for key, vector in vectors.items():
+                self._remember(key, np.asarray(vector, dtype=np.float32))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM emb").fetchone()[0]
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
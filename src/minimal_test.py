@@ -11,9 +11,13 @@ bot = commands.Bot(command_prefix='!', intents=discord.Intents.default())
 async def test(ctx):
     await ctx.send('Test działa!')
 
-@bot.command()
-async def health(ctx):
-    await ctx.send('ping')
+@bot.event
+async def on_message(message):
+    # !health is answered straight from the event, skipping command dispatch
+    if message.content == '!health':
+        await message.channel.send('ping')
+        return
+    await bot.process_commands(message)
 
 @bot.event
 async def on_ready():
@@ -4,30 +4,33 @@ Startup script for the Discord ClickUp Bot.
 This script checks dependencies and starts the bot with proper error handling.
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
-import importlib.util
+
+# Top-level modules the bot needs, mapped to the pip package that provides them
+# (h2 is what httpx needs for the shared HTTP/2 client)
+PACKAGES = {
+    'discord': 'discord.py',
+    'dotenv': 'python-dotenv',
+    'httpx': 'httpx[http2]',
+    'h2': 'h2',
+    'numpy': 'numpy',
+    'openai': 'openai',
+    'orjson': 'orjson',
+    'rapidfuzz': 'rapidfuzz',
+}
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
-    dependencies = [
-        ('discord', 'discord.py'),
-        ('aiohttp', 'aiohttp'),
-        ('requests', 'requests'),
-        ('dotenv', 'python-dotenv')
-    ]
-    
-    missing = []
-    
-    for module_name, package_name in dependencies:
-        if importlib.util.find_spec(module_name) is None:
-            missing.append(package_name)
+    # find_spec locates each module without importing it, so every missing one is reported at once
+    missing = [package for module, package in PACKAGES.items() if importlib.util.find_spec(module) is None]
     
     if missing:
         print("❌ Missing dependencies:")
-        for dep in missing:
-            print(f"   - {dep}")
+        for package in missing:
+            print(f"   - {package}")
         print()
         print("📦 Install missing dependencies with:")
         print(f"   pip install {' '.join(missing)}")
@@ -0,0 +1,21 @@
+import asyncio
+import types
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def clickup_http():
+    """httpx client on a mock transport; records requests, replays queued responses, then answers with payload"""
+    api = types.SimpleNamespace(requests=[], responses=[], payload={})
+
+    def handler(request):
+        api.requests.append(request)
+        if api.responses:
+            return api.responses.pop(0)
+        return httpx.Response(200, json=api.payload)
+
+    api.http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    yield api
+    asyncio.run(api.http.aclose())
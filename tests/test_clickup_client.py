@@ -1,76 +1,177 @@
-import builtins
-from unittest.mock import Mock, patch
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
 
 from bot import ClickUpClient
 
 
-def test_get_folder_lists_success():
-    client = ClickUpClient("token", "list", folder_id="folder")
+def test_get_folder_lists_success(clickup_http):
     expected = [{"id": "1"}, {"id": "2"}]
-    with patch("bot.requests.get") as mock_get:
-        mock_resp = Mock()
-        mock_resp.raise_for_status.return_value = None
-        mock_resp.json.return_value = {"lists": expected}
-        mock_get.return_value = mock_resp
+    clickup_http.payload = {"lists": expected}
+    client = ClickUpClient("token", "list", folder_id="folder", http=clickup_http.http)
+
+    lists = asyncio.run(client.get_folder_lists())
+    assert lists == expected
+    assert len(clickup_http.requests) == 1
+    assert str(clickup_http.requests[0].url) == "https://api.clickup.com/api/v2/folder/folder/list"
+    assert clickup_http.requests[0].headers["Authorization"] == "token"
+
+
+def test_get_folder_lists_cached(clickup_http):
+    clickup_http.payload = {"lists": [{"id": "1"}]}
+    client = ClickUpClient("token", "list", folder_id="folder", http=clickup_http.http)
 
-        lists = client.get_folder_lists()
-        assert lists == expected
-        mock_get.assert_called_once_with(
-            "https://api.clickup.com/api/v2/folder/folder/list",
-            headers=client.headers,
-        )
+    async def fetch_twice():
+        await client.get_folder_lists()
+        return await client.get_folder_lists()
+
+    assert asyncio.run(fetch_twice()) == [{"id": "1"}]
+    assert len(clickup_http.requests) == 1
+
+    client.invalidate_lists_cache()
+    asyncio.run(client.get_folder_lists())
+    assert len(clickup_http.requests) == 2
 
 
 def test_get_folder_lists_no_folder():
     client = ClickUpClient("token", "list")
-    assert client.get_folder_lists() == []
+    assert asyncio.run(client.get_folder_lists()) == []
 
 
 def test_get_newest_list_from_folder():
     client = ClickUpClient("token", "list", folder_id="folder")
     lists = [{"id": "1"}, {"id": "2"}]
-    with patch.object(client, "get_folder_lists", return_value=lists):
-        newest = client.get_newest_list_from_folder()
+    with patch.object(client, "get_folder_lists", AsyncMock(return_value=lists)):
+        newest = asyncio.run(client.get_newest_list_from_folder())
         assert newest == lists[-1]
 
 
-def test_create_task_success():
-    client = ClickUpClient("token", "123")
-    with patch("bot.requests.post") as mock_post:
-        mock_resp = Mock()
-        mock_resp.raise_for_status.return_value = None
-        mock_resp.json.return_value = {"id": "task"}
-        mock_post.return_value = mock_resp
+def test_create_task_success(clickup_http):
+    clickup_http.payload = {"id": "task"}
+    client = ClickUpClient("token", "123", http=clickup_http.http)
 
-        result = client.create_task("Title", "Desc")
-        assert result == {"id": "task"}
-        mock_post.assert_called_once()
-        assert mock_post.call_args[0][0] == "https://api.clickup.com/api/v2/list/123/task"
+    result = asyncio.run(client.create_task("Title", "Desc"))
+    assert result == {"id": "task"}
+    assert len(clickup_http.requests) == 1
+    assert clickup_http.requests[0].method == "POST"
+    assert str(clickup_http.requests[0].url) == "https://api.clickup.com/api/v2/list/123/task"
+    body = json.loads(clickup_http.requests[0].content)
+    assert body["name"] == "Title"
+    assert body["description"] == "Desc"
 
 
-def test_update_task_status():
-    client = ClickUpClient("token", "list")
-    with patch("bot.requests.put") as mock_put:
-        mock_resp = Mock()
-        mock_resp.raise_for_status.return_value = None
-        mock_resp.json.return_value = {"status": "complete"}
-        mock_put.return_value = mock_resp
+def test_update_task_status(clickup_http):
+    clickup_http.payload = {"status": "complete"}
+    client = ClickUpClient("token", "list", http=clickup_http.http)
 
-        result = client.update_task_status("id1", "complete")
-        assert result == {"status": "complete"}
-        mock_put.assert_called_once()
-        assert mock_put.call_args[0][0] == "https://api.clickup.com/api/v2/task/id1"
+    result = asyncio.run(client.update_task_status("id1", "complete"))
+    assert result == {"status": "complete"}
+    assert len(clickup_http.requests) == 1
+    assert clickup_http.requests[0].method == "PUT"
+    assert str(clickup_http.requests[0].url) == "https://api.clickup.com/api/v2/task/id1"
 
 
-def test_assign_task():
-    client = ClickUpClient("token", "list")
-    with patch("bot.requests.post") as mock_post:
-        mock_resp = Mock()
-        mock_resp.raise_for_status.return_value = None
-        mock_resp.json.return_value = {"assignee": "user"}
-        mock_post.return_value = mock_resp
-
-        result = client.assign_task("id1", "u1")
-        assert result == {"assignee": "user"}
-        mock_post.assert_called_once()
-        assert mock_post.call_args[0][0] == "https://api.clickup.com/api/v2/task/id1/assignee/u1"
+def test_assign_task(clickup_http):
+    clickup_http.payload = {"assignee": "user"}
+    client = ClickUpClient("token", "list", http=clickup_http.http)
+
+    result = asyncio.run(client.assign_task("id1", "u1"))
+    assert result == {"assignee": "user"}
+    assert len(clickup_http.requests) == 1
+    assert clickup_http.requests[0].method == "POST"
+    assert str(clickup_http.requests[0].url) == "https://api.clickup.com/api/v2/task/id1/assignee/u1"
+
+
+def test_create_task_retries_rate_limit(clickup_http):
+    clickup_http.responses.append(httpx.Response(429, headers={"Retry-After": "2"}))
+    clickup_http.payload = {"id": "task"}
+    client = ClickUpClient("token", "123", http=clickup_http.http)
+
+    sleep = AsyncMock()
+    with patch("bot.asyncio.sleep", sleep):
+        result = asyncio.run(client.create_task("Title", "Desc"))
+    assert result == {"id": "task"}
+    assert len(clickup_http.requests) == 2
+    sleep.assert_awaited_once()
+    assert sleep.await_args.args[0] >= 2
+
+
+def test_get_tasks_from_list_cached_until_update(clickup_http):
+    clickup_http.payload = {"tasks": [{"id": "t1"}]}
+    client = ClickUpClient("token", "list", http=clickup_http.http)
+
+    async def fetch_update_fetch():
+        await client.get_tasks_from_list("sprint")
+        await client.get_tasks_from_list("sprint")
+        assert len(clickup_http.requests) == 1
+        await client.update_task_status("t1", "complete")
+        return await client.get_tasks_from_list("sprint")
+
+    assert asyncio.run(fetch_update_fetch()) == [{"id": "t1"}]
+    assert [request.method for request in clickup_http.requests] == ["GET", "PUT", "GET"]
+
+
+def test_get_newest_sprint_with_list():
+    client = ClickUpClient("token", "list", folder_id="folder")
+    lists = [{"id": "1"}, {"id": "2", "name": "Sprint 2"}]
+    tasks = [{"id": "t1"}]
+    with patch.object(client, "get_folder_lists", AsyncMock(return_value=lists)), \
+            patch.object(client, "get_tasks_from_list", AsyncMock(return_value=tasks)) as get_tasks:
+        assert asyncio.run(client.get_newest_sprint_with_list()) == (lists[-1], tasks)
+        get_tasks.assert_awaited_once_with("2")
+
+
+def test_context_manager_closes_owned_client():
+    async def use_client():
+        async with ClickUpClient("token", "list") as client:
+            assert not client._http.is_closed
+        return client
+
+    assert asyncio.run(use_client())._http.is_closed
+
+
+def test_newest_list_memoized_until_lists_refetch(clickup_http):
+    clickup_http.payload = {"lists": [{"id": "1"}, {"id": "2"}]}
+    client = ClickUpClient("token", "list", folder_id="folder", http=clickup_http.http)
+
+    async def pick_twice():
+        first = await client.get_newest_list_from_folder()
+        return first, await client.get_newest_list_from_folder()
+
+    first, second = asyncio.run(pick_twice())
+    assert first is second
+    assert first == {"id": "2"}
+
+    clickup_http.payload = {"lists": [{"id": "1"}, {"id": "2"}, {"id": "3"}]}
+    client.invalidate_lists_cache()
+    assert asyncio.run(client.get_newest_list_from_folder()) == {"id": "3"}
+
+
+def test_create_task_does_not_retry_gateway_errors(clickup_http):
+    clickup_http.responses.append(httpx.Response(504))
+    client = ClickUpClient("token", "123", http=clickup_http.http)
+
+    sleep = AsyncMock()
+    with patch("bot.asyncio.sleep", sleep), pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.create_task("Title", "Desc"))
+    assert len(clickup_http.requests) == 1
+    sleep.assert_not_awaited()
+
+
+def test_get_retries_gateway_errors_without_holding_a_slot(clickup_http):
+    clickup_http.responses.append(httpx.Response(503))
+    clickup_http.payload = {"lists": [{"id": "1"}]}
+    client = ClickUpClient("token", "list", folder_id="folder", http=clickup_http.http)
+
+    async def sleep(delay):
+        # Every slot is free while backing off
+        assert client._semaphore._value == 8
+    with patch("bot.asyncio.sleep", AsyncMock(side_effect=sleep)):
+        assert asyncio.run(client.get_folder_lists()) == [{"id": "1"}]
+    assert len(clickup_http.requests) == 2
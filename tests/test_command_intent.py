@@ -0,0 +1,82 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import bot
+
+
+def mock_openai(monkeypatch):
+    create = AsyncMock(side_effect=AssertionError("OpenAI should not be called"))
+    monkeypatch.setattr(bot, "openai_client", Mock(chat=Mock(completions=Mock(create=create))))
+    return create
+
+
+def test_empty_message_skips_openai(monkeypatch):
+    create = mock_openai(monkeypatch)
+
+    assert asyncio.run(bot.is_task_creation_command("   ")) is False
+    create.assert_not_awaited()
+
+
+def test_exact_command_skips_openai(monkeypatch):
+    create = mock_openai(monkeypatch)
+
+    assert asyncio.run(bot.is_task_creation_command("  Dodaj Taska ")) is True
+    assert asyncio.run(bot.is_task_creation_command("task")) is True
+    create.assert_not_awaited()
+
+
+def test_command_phrase_must_be_whole_message():
+    for command in ["please create task", "task this", "wrzuć to do backlog", "zapisz to!"]:
+        assert bot._quick_intent(command, len(command.split()), command.lower()) is True
+    for text in ["add task filtering to dashboard", "create task templates",
+                 "task from the meeting notes", "zapisz to w bazie danych"]:
+        assert bot._quick_intent(text, len(text.split()), text.lower()) is None
+
+
+def test_description_verb_beats_command_phrase(monkeypatch):
+    create = mock_openai(monkeypatch)
+
+    for text in ["Fix task from yesterday", "Implement add task button", "napraw zapisz to"]:
+        assert asyncio.run(bot.is_task_creation_command(text)) is False
+    create.assert_not_awaited()
+
+
+def test_parse_update_command_trailing_status():
+    assert bot.parse_update_command("fix login bug in progress") == ("fix login bug", "in progress")
+    assert bot.parse_update_command("!update dokumentacja closed") == ("dokumentacja", "complete")
+    assert bot.parse_update_command("dokumentacja") == (None, None)
+
+
+def test_update_command_reads_status_from_description(monkeypatch):
+    monkeypatch.setattr(bot, "openai_client", None)
+    task = {"id": "t1", "name": "Fix login bug", "status": {"status": "to do"}}
+    clickup = Mock(
+        get_tasks_from_newest_sprint=AsyncMock(return_value=[task]),
+        update_task_status=AsyncMock(return_value={}),
+    )
+    monkeypatch.setattr(bot.bot, "clickup", clickup)
+    interaction = Mock(response=Mock(defer=AsyncMock()), followup=Mock(send=AsyncMock()))
+
+    asyncio.run(bot.update_command.callback(interaction, "fix login bug in progress"))
+
+    clickup.update_task_status.assert_awaited_once_with("t1", "in progress")
+
+
+@pytest.mark.parametrize("status,expected", [
+    ("in progress", "in progress"),
+    ("in-progress", "in progress"),
+    ("In_Progress", "in progress"),
+    ("  in   progress ", "in progress"),
+    ("in-review", "in review"),
+    ("to-do", "to do"),
+    ("todo", "to do"),
+    ("Closed", "complete"),
+    ("in-limbo", None),
+])
+def test_normalize_status_spellings(status, expected):
+    assert bot.normalize_status(status) == expected
@@ -0,0 +1,48 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+from collections import OrderedDict
+from unittest.mock import patch
+
+import pytest
+
+import bot
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Empty completion cache on a hand-driven monotonic clock"""
+    monkeypatch.setattr(bot, "_completion_cache", OrderedDict())
+    now = [1000.0]
+    with patch("bot.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+def test_key_depends_on_every_input():
+    key = bot._completion_key("model", "system", "user")
+    assert key == bot._completion_key("model", "system", "user")
+    assert key != bot._completion_key("other", "system", "user")
+    assert key != bot._completion_key("model", "system", "other")
+
+
+def test_entries_expire_after_ttl(clock):
+    bot._cache_put("key", "content")
+
+    clock[0] += bot._COMPLETION_CACHE_TTL
+    assert bot._cache_get("key") == "content"
+
+    clock[0] += 1
+    assert bot._cache_get("key") is None
+    assert "key" not in bot._completion_cache
+
+
+def test_least_recently_used_entry_is_evicted(clock, monkeypatch):
+    monkeypatch.setattr(bot, "_COMPLETION_CACHE_SIZE", 2)
+    bot._cache_put("a", "A")
+    bot._cache_put("b", "B")
+    assert bot._cache_get("a") == "A"
+
+    bot._cache_put("c", "C")
+    assert bot._cache_get("b") is None
+    assert bot._cache_get("a") == "A"
+    assert bot._cache_get("c") == "C"
@@ -0,0 +1,89 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+import types
+from collections import OrderedDict
+from unittest.mock import AsyncMock, Mock
+
+import bot
+
+
+MESSAGES = [
+    "Ola: are you coming for lunch with the team?",
+    "Piotr: the login page fails on mobile",
+    "Ola: and the standup moved to ten",
+    "Piotr: nice weekend everyone",
+]
+
+
+def test_overlap_ignores_short_and_common_words():
+    # "the", "and", "for" and "this" appear everywhere and must not count
+    assert bot._overlapping_messages("fix the login for this page and", MESSAGES) == [MESSAGES[1]]
+    assert bot._overlapping_messages("the and for you this", MESSAGES) == []
+
+
+def test_prefilter_keeps_newest_for_short_requests_and_quiet_channels():
+    assert bot._prefilter_context("fix login", MESSAGES) == MESSAGES[-3:]
+    assert bot._prefilter_context("investigate why the login page fails", MESSAGES[:3]) == MESSAGES[:3]
+
+
+def test_prefilter_skips_ai_only_without_overlap():
+    assert bot._prefilter_context("investigate the payment gateway timeouts", MESSAGES) == []
+    assert bot._prefilter_context("investigate why the login page fails", MESSAGES) is None
+
+
+def test_short_request_still_gets_ai_title(monkeypatch):
+    class Stream:
+        def __init__(self, text):
+            self._chunks = [types.SimpleNamespace(choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=text))])]
+        def __aiter__(self):
+            return self._iter()
+        async def _iter(self):
+            for chunk in self._chunks:
+                yield chunk
+        async def close(self):
+            pass
+
+    create = AsyncMock(return_value=Stream('{"relevant_indices": [1], "title": "Fix mobile login"}'))
+    monkeypatch.setattr(bot, "openai_client", Mock(chat=Mock(completions=Mock(create=create))))
+    monkeypatch.setattr(bot, "_embed_text", AsyncMock(return_value=None))
+    monkeypatch.setattr(bot, "_completion_cache", OrderedDict())
+
+    context, title = asyncio.run(bot.analyze_task_request("fix login", MESSAGES))
+    assert title == "Fix mobile login"
+    assert context == [MESSAGES[1]]
+    assert "(no messages)" in create.await_args.kwargs["messages"][1]["content"]
+
+
+def test_long_message_is_capped():
+    capped = bot._truncate_message("x" * 1000)
+    assert capped == "x" * bot._MAX_CONTEXT_MESSAGE_CHARS + "…"
+    assert bot._truncate_message("short") == "short"
+
+
+def test_numbering_keeps_newest_messages_within_budget(monkeypatch):
+    monkeypatch.setattr(bot, "_MAX_CONTEXT_CHARS", 40)
+    messages = ["first message", "second message", "third message"]
+
+    # Each numbered line costs its length plus a newline; only the last two fit
+    assert bot._number_messages(messages) == "2. second message\n3. third message"
+    assert bot._number_messages([]) == ""
+
+
+def test_code_blocks_are_replaced_with_placeholder():
+    content = "see trace\n```\nTraceback (most recent call last):\n  boom\n```\nand ```x = 1``` too"
+    assert bot._truncate_message(content) == "see trace\n[code omitted]\nand [code omitted] too"
+    # An unclosed fence is left alone
+    assert bot._truncate_message("```half open") == "```half open"
+
+
+def test_fallback_title_shortening():
+    # A single over-long word is cut mid-word rather than reduced to the placeholder
+    assert bot._fallback_title("a" * 80) == "a" * 50 + "..."
+    exact = "Fix the login bug on the mobile app for all the users"
+    assert len(exact) == 53
+    assert bot._fallback_title(exact) == exact
+    assert bot._fallback_title("Fix the login bug in the mobile application; Android first") == \
+        "Fix the login bug in the mobile application..."
+    assert bot._fallback_title("Ship it.") == "Ship it."
@@ -0,0 +1,94 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pytest
+
+import bot
+from embedding_cache import EmbeddingCache
+
+
+def test_put_and_get_many(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "emb.sqlite3"))
+    cache.put_many({"a": np.array([1.0, 0.0], dtype=np.float32), "b": np.array([0.0, 1.0], dtype=np.float32)})
+
+    found = cache.get_many(["a", "b", "c"])
+    assert set(found) == {"a", "b"}
+    assert np.array_equal(found["a"], [1.0, 0.0])
+    assert len(cache) == 2
+    cache.close()
+
+
+def test_vectors_persist_across_instances(tmp_path):
+    path = str(tmp_path / "emb.sqlite3")
+    cache = EmbeddingCache(path)
+    cache.put_many({"a": np.array([0.5, 0.5], dtype=np.float32)})
+    cache.close()
+
+    reopened = EmbeddingCache(path)
+    found = reopened.get_many(["a"])
+    assert found["a"].dtype == np.float32
+    assert np.array_equal(found["a"], [0.5, 0.5])
+    reopened.close()
+
+
+def test_put_replaces_existing_key(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "emb.sqlite3"))
+    cache.put_many({"a": np.array([1.0], dtype=np.float32)})
+    cache.put_many({"a": np.array([2.0], dtype=np.float32)})
+
+    assert len(cache) == 1
+    assert cache.get_many(["a"])["a"][0] == 2.0
+    cache.close()
+
+
+def test_memory_keeps_most_recently_used(tmp_path):
+    cache = EmbeddingCache(str(tmp_path / "emb.sqlite3"), max_memory=2)
+    cache.put_many({"a": np.array([1.0], dtype=np.float32), "b": np.array([2.0], dtype=np.float32)})
+    cache.get_many(["a"])
+    cache.put_many({"c": np.array([3.0], dtype=np.float32)})
+
+    assert list(cache._memory) == ["a", "c"]
+    assert cache.get_many(["b"])["b"][0] == 2.0
+    cache.close()
+
+
+TASKS = [{"id": "1", "name": "Login page"}, {"id": "2", "name": "Payments"}]
+
+
+def test_warm_up_embeds_only_uncached_tasks(monkeypatch):
+    cache = EmbeddingCache(":memory:")
+    cache.put_many({bot._task_key(TASKS[0]): np.array([1.0, 0.0], dtype=np.float32)})
+    monkeypatch.setattr(bot.bot, "embedding_cache", cache)
+    embed = AsyncMock(return_value=np.array([[0.0, 1.0]], dtype=np.float32))
+    monkeypatch.setattr(bot, "_embed_texts", embed)
+
+    keys = [bot._task_key(task) for task in TASKS]
+    query_vector, matrix = asyncio.run(bot._load_vectors(keys, [bot._task_text(task) for task in TASKS]))
+
+    embed.assert_awaited_once_with([bot._task_text(TASKS[1])])
+    assert query_vector is None
+    assert np.array_equal(matrix, [[1.0, 0.0], [0.0, 1.0]])
+    assert set(cache.get_many(keys)) == set(keys)
+    cache.close()
+
+
+def test_warm_loop_survives_api_errors(monkeypatch):
+    monkeypatch.setattr(bot.bot, "embedding_cache", EmbeddingCache(":memory:"))
+    clickup = Mock(get_tasks_from_newest_sprint=AsyncMock(side_effect=[RuntimeError("ClickUp down"), TASKS]))
+    monkeypatch.setattr(bot.bot, "clickup", clickup)
+    embed = AsyncMock(return_value=np.eye(2, dtype=np.float32))
+    monkeypatch.setattr(bot, "_embed_texts", embed)
+
+    # The second sleep stops the loop after two refreshes
+    sleep = AsyncMock(side_effect=[None, asyncio.CancelledError()])
+    with patch("bot.asyncio.sleep", sleep), pytest.raises(asyncio.CancelledError):
+        asyncio.run(bot.warm_embedding_cache())
+
+    assert clickup.get_tasks_from_newest_sprint.await_count == 2
+    embed.assert_awaited_once()
+    bot.bot.embedding_cache.close()
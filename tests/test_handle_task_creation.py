@@ -1,11 +1,13 @@
-import types
-from datetime import datetime
-from unittest.mock import AsyncMock, Mock
 import asyncio
 import types
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
 
 import bot
 
+# Fixed message timestamp keeps the generated description deterministic
+FROZEN_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class DummyTyping:
     async def __aenter__(self):
@@ -33,10 +35,10 @@ def test_handle_task_creation_creates_task(monkeypatch):
     channel = DummyChannel()
     message = types.SimpleNamespace(
         content="<@42> implement feature",
-        author=types.SimpleNamespace(display_name="User", name="user", discriminator="0001"),
+        author=types.SimpleNamespace(id=7, display_name="User", name="user", discriminator="0001"),
         channel=channel,
         guild=types.SimpleNamespace(name="Guild"),
-        created_at=datetime.utcnow(),
+        created_at=FROZEN_NOW,
         jump_url="http://discord/message",
     )
 
@@ -44,17 +46,125 @@ def test_handle_task_creation_creates_task(monkeypatch):
         message.replied = embed
     message.reply = reply
 
+    monkeypatch.setattr(bot, "_recent_tasks", {})
     monkeypatch.setattr(bot, "is_task_creation_command", AsyncMock(return_value=False))
     monkeypatch.setattr(bot, "get_channel_context", AsyncMock(return_value=[]))
-    monkeypatch.setattr(bot, "filter_relevant_context", AsyncMock(return_value=[]))
-    monkeypatch.setattr(bot, "generate_smart_title", AsyncMock(return_value="Test Title"))
-    monkeypatch.setattr(bot, "determine_target_list", lambda content: (None, "Backlog"))
+    monkeypatch.setattr(bot, "analyze_task_request", AsyncMock(return_value=([], "Test Title")))
+    monkeypatch.setattr(bot, "determine_target_list", AsyncMock(return_value=(None, "Backlog")))
 
-    create_mock = Mock(return_value={"id": "1"})
-    monkeypatch.setattr(bot.clickup_client, "create_task", create_mock)
+    create_mock = AsyncMock(return_value={"id": "1"})
+    monkeypatch.setattr(bot.bot, "clickup", Mock(create_task=create_mock))
 
     asyncio.run(bot.handle_task_creation(message))
 
-    create_mock.assert_called_once()
+    create_mock.assert_awaited_once()
+    assert "**Timestamp:** 2024-01-01 00:00:00+00:00" in create_mock.await_args.kwargs["description"]
     assert hasattr(message, "replied")
     assert message.replied.title.startswith("✅")
+
+    # The same request again right away is treated as a retry
+    message.reply = AsyncMock()
+    asyncio.run(bot.handle_task_creation(message))
+    create_mock.assert_awaited_once()
+    message.reply.assert_awaited_once()
+
+
+def test_enqueued_mention_is_handled_by_worker(monkeypatch):
+    handle_mock = AsyncMock()
+    monkeypatch.setattr(bot, "handle_task_creation", handle_mock)
+
+    ack = types.SimpleNamespace()
+    message = types.SimpleNamespace(reply=AsyncMock(return_value=ack))
+
+    async def run():
+        monkeypatch.setattr(bot, "task_queue", asyncio.Queue())
+        worker = asyncio.create_task(bot.task_worker())
+        await bot.enqueue_task_creation(message)
+        await bot.task_queue.join()
+        worker.cancel()
+
+    asyncio.run(run())
+
+    message.reply.assert_awaited_once()
+    handle_mock.assert_awaited_once_with(message, ack)
+
+
+def test_enqueue_reports_busy_when_queue_fills_during_ack(monkeypatch):
+    ack = types.SimpleNamespace(edit=AsyncMock())
+
+    async def reply(content):
+        # Another handler takes the last slot while this reply is in flight
+        bot.task_queue.put_nowait(("other", None))
+        return ack
+    message = types.SimpleNamespace(reply=reply)
+
+    async def run():
+        monkeypatch.setattr(bot, "task_queue", asyncio.Queue(maxsize=1))
+        await bot.enqueue_task_creation(message)
+
+    asyncio.run(run())
+
+    ack.edit.assert_awaited_once_with(content=bot._BUSY_REPLY)
+
+
+def make_channel(monkeypatch):
+    monkeypatch.setattr(bot, "_channel_buffers", {})
+    monkeypatch.setattr(bot, "_seed_limits", {})
+    channel = DummyChannel()
+    channel.id = 1
+    return channel
+
+
+def make_message(channel, message_id, content, bot_author=False):
+    author = types.SimpleNamespace(bot=bot_author, display_name="User")
+    return types.SimpleNamespace(id=message_id, content=content, author=author, channel=channel)
+
+
+def test_channel_context_served_from_buffer(monkeypatch):
+    channel = make_channel(monkeypatch)
+
+    # History is newest first
+    channel._history = [make_message(channel, 3, "second"), make_message(channel, 2, "ack", bot_author=True),
+                        make_message(channel, 1, "first")]
+    assert asyncio.run(bot.get_channel_context(channel, limit=3)) == ["User: first", "User: second"]
+
+    channel._history = []
+    bot.remember_message(make_message(channel, 4, "third"))
+    assert asyncio.run(bot.get_channel_context(channel, limit=3)) == ["User: second", "User: third"]
+
+
+def test_edits_and_deletes_update_buffered_lines(monkeypatch):
+    channel = make_channel(monkeypatch)
+    channel._history = [make_message(channel, 3, "third"), make_message(channel, 2, "ack", bot_author=True),
+                        make_message(channel, 1, "first")]
+    asyncio.run(bot.get_channel_context(channel, limit=3))
+    # Nothing below may refetch history
+    channel._history = []
+
+    def edit(message_id, **data):
+        asyncio.run(bot.on_raw_message_edit(types.SimpleNamespace(channel_id=1, message_id=message_id, data=data)))
+
+    edit(2, content="✅ Task created")
+    edit(3, embeds=[])
+    edit(1, content="first, edited")
+    assert asyncio.run(bot.get_channel_context(channel, limit=3)) == ["User: first, edited", "User: third"]
+
+    asyncio.run(bot.on_raw_message_delete(types.SimpleNamespace(channel_id=1, message_id=1)))
+    assert asyncio.run(bot.get_channel_context(channel, limit=3)) == ["User: third"]
+
+    asyncio.run(bot.on_raw_bulk_message_delete(types.SimpleNamespace(channel_id=1, message_ids={2, 3})))
+    assert asyncio.run(bot.get_channel_context(channel, limit=3)) == []
+
+
+def test_messages_arriving_during_seed_are_kept(monkeypatch):
+    channel = make_channel(monkeypatch)
+    arrived = make_message(channel, 2, "arrived while seeding")
+
+    def history(limit=20):
+        async def generator():
+            bot.remember_message(arrived)
+            yield make_message(channel, 1, "older")
+        return generator()
+    channel.history = history
+
+    assert asyncio.run(bot.get_channel_context(channel, limit=3)) == ["User: older", "User: arrived while seeding"]
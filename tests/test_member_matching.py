@@ -0,0 +1,45 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import bot
+
+
+MEMBERS = [
+    {"user": {"id": 1, "username": "jan.kowalski", "email": "jan_k@example.com"}},
+    {"user": {"id": 2, "username": "anna-nowak", "email": "anna@example.com"}},
+]
+
+
+def test_fallback_picks_best_fuzzy_match(monkeypatch):
+    monkeypatch.setattr(bot, "openai_client", None)
+
+    match = asyncio.run(bot.match_member_by_name("Anna", MEMBERS))
+    assert match is MEMBERS[1]
+
+
+def test_fallback_rejects_weak_matches(monkeypatch):
+    monkeypatch.setattr(bot, "openai_client", None)
+
+    assert asyncio.run(bot.match_member_by_name("zbigniew", MEMBERS)) is None
+
+
+def test_update_command_assigns_matched_member(monkeypatch):
+    monkeypatch.setattr(bot, "openai_client", None)
+    task = {"id": "t1", "name": "Login page", "status": {"status": "to do"}}
+    clickup = Mock(
+        get_tasks_from_newest_sprint=AsyncMock(return_value=[task]),
+        update_task_status=AsyncMock(return_value={}),
+        get_team_members=AsyncMock(return_value=MEMBERS),
+        assign_task=AsyncMock(return_value={}),
+    )
+    monkeypatch.setattr(bot.bot, "clickup", clickup)
+    interaction = Mock(response=Mock(defer=AsyncMock()), followup=Mock(send=AsyncMock()))
+
+    asyncio.run(bot.update_command.callback(interaction, "login page", "closed", assignee="Anna"))
+
+    clickup.assign_task.assert_awaited_once_with("t1", 2)
+    embed = interaction.followup.send.await_args.kwargs["embed"]
+    assert {"name": "👤 Assignee", "value": "anna-nowak", "inline": True} in embed.to_dict()["fields"]
@@ -0,0 +1,82 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+import types
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+import bot
+
+
+TASKS = [
+    {"id": "1", "name": "Login page", "description": "Fix the login form"},
+    {"id": "2", "name": "Payments", "description": "Add card payments"},
+    {"id": "3", "name": "Docs", "description": "Write the API docs"},
+]
+
+
+def unit(*values):
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture
+def matcher(monkeypatch):
+    """find_similar_task with fixed task embeddings and a scripted GPT reply"""
+    monkeypatch.setattr(bot.bot, "embedding_cache", None)
+    api = types.SimpleNamespace(vectors=[], reply="1")
+
+    async def embed_texts(texts):
+        return np.stack(api.vectors[:len(texts)])
+    api.embed = AsyncMock(side_effect=embed_texts)
+    monkeypatch.setattr(bot, "_embed_texts", api.embed)
+
+    async def create(**kwargs):
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=api.reply))])
+    api.create = AsyncMock(side_effect=create)
+    monkeypatch.setattr(bot, "openai_client", Mock(chat=Mock(completions=Mock(create=api.create))))
+    return api
+
+
+def test_below_threshold_returns_none(matcher):
+    # Query first, then one vector per task; the best cosine score is 0.6
+    matcher.vectors = [unit(1, 0, 0, 0), unit(0.6, 0.8, 0, 0), unit(0, 1, 0, 0), unit(0, 0, 1, 0)]
+
+    assert asyncio.run(bot.find_similar_task("something else entirely", TASKS)) is None
+    matcher.create.assert_not_awaited()
+
+
+def test_clear_winner_skips_gpt(matcher):
+    matcher.vectors = [unit(1, 0, 0), unit(0.95, 0.31, 0), unit(0.5, 0.87, 0), unit(0, 0, 1)]
+
+    assert asyncio.run(bot.find_similar_task("broken sign in", TASKS)) is TASKS[0]
+    matcher.create.assert_not_awaited()
+
+
+def test_near_tie_asks_gpt_among_contenders(matcher):
+    matcher.vectors = [unit(1, 0, 0), unit(0.95, 0.31, 0), unit(0.94, 0, 0.34), unit(0, 1, 0)]
+    matcher.reply = "2"
+
+    assert asyncio.run(bot.find_similar_task("sign in and pay", TASKS)) is TASKS[1]
+    matcher.create.assert_awaited_once()
+    prompt = matcher.create.await_args.kwargs["messages"][1]["content"]
+    assert "Docs" not in prompt
+
+
+def test_near_tie_gpt_none_returns_none(matcher):
+    matcher.vectors = [unit(1, 0, 0), unit(0.95, 0.31, 0), unit(0.94, 0, 0.34), unit(0, 1, 0)]
+    matcher.reply = "none"
+
+    assert asyncio.run(bot.find_similar_task("sign in and pay", TASKS)) is None
+
+
+def test_exact_name_skips_embeddings_and_gpt(matcher):
+    tasks = TASKS + [{"id": "4", "name": "Login page redesign "}]
+
+    assert asyncio.run(bot.find_similar_task("  LOGIN page ", tasks)) is TASKS[0]
+    assert asyncio.run(bot.find_similar_task("login page redesign", tasks)) is tasks[3]
+    matcher.embed.assert_not_awaited()
+    matcher.create.assert_not_awaited()
@@ -0,0 +1,56 @@
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+import asyncio
+from collections import OrderedDict
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+
+import bot
+
+
+def unit(*values):
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_lookup_respects_threshold():
+    cache = bot.SemanticTitleCache(threshold=0.9)
+    assert cache.lookup(unit(1, 0)) is None
+
+    cache.add(unit(1, 0), "Fix login")
+    assert cache.lookup(unit(1, 0.1)) == "Fix login"
+    assert cache.lookup(unit(1, 1)) is None
+
+
+def test_add_evicts_least_recently_used():
+    cache = bot.SemanticTitleCache(threshold=0.99, max_entries=2)
+    cache.add(unit(1, 0, 0), "A")
+    cache.add(unit(0, 1, 0), "B")
+    cache.lookup(unit(1, 0, 0))
+    cache.add(unit(0, 0, 1), "C")
+
+    assert cache.lookup(unit(1, 0, 0)) == "A"
+    assert cache.lookup(unit(0, 1, 0)) is None
+    assert cache.lookup(unit(0, 0, 1)) == "C"
+
+
+def test_hit_embeds_request_only_and_still_selects_context(monkeypatch):
+    title_cache = bot.SemanticTitleCache()
+    title_cache.add(unit(1, 0), "Fix login on mobile")
+    monkeypatch.setattr(bot, "_title_cache", title_cache)
+    monkeypatch.setattr(bot, "_completion_cache", OrderedDict())
+    embed = AsyncMock(return_value=unit(1, 0))
+    monkeypatch.setattr(bot, "_embed_text", embed)
+    stream = Mock(close=AsyncMock())
+    monkeypatch.setattr(bot, "openai_client", Mock(chat=Mock(completions=Mock(create=AsyncMock(return_value=stream)))))
+
+    request = "login is broken for mobile users again"
+    messages = ["lunch anyone?", "login fails on mobile since friday", "standup moved", "nice weekend"]
+    context, title = asyncio.run(bot.analyze_task_request(request, messages))
+
+    assert title == "Fix login on mobile"
+    assert context == ["login fails on mobile since friday"]
+    embed.assert_awaited_once_with(request)
+    stream.close.assert_awaited_once()